@@ -7,12 +7,16 @@ NO SIMULATION EVER!
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, time
 from typing import Dict, Optional, List
 import os
 
 logger = logging.getLogger(__name__)
 
+# NSE trading session (local time)
+MARKET_OPEN = time(9, 15)
+MARKET_CLOSE = time(15, 30)
+
 class HybridDataProvider:
     """
     Hybrid real data provider - TrueData primary, Zerodha fallback
@@ -214,11 +218,7 @@ class HybridDataProvider:
     
     def _is_market_open(self) -> bool:
         """Check if market is open"""
-        current_time = datetime.now().time()
-        market_open = datetime.strptime("09:15", "%H:%M").time()
-        market_close = datetime.strptime("15:30", "%H:%M").time()
-        
-        return market_open <= current_time <= market_close
+        return MARKET_OPEN <= datetime.now().time() <= MARKET_CLOSE
     
     def get_provider_status(self) -> Dict:
         """Get status of all providers"""
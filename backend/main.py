@@ -52,6 +52,8 @@ async def lifespan(app: FastAPI):
         
         # Initialize Redis
         redis_client = await init_redis()
+        # Shared with routers that need it (the /auth/login rate limit)
+        app.state.redis = redis_client
         
         # Initialize database manager
         database_manager = None
@@ -23,6 +23,7 @@ from src.app_state import app_state, AppState, MarketDataState, StrategyState, T
 from src.core.schemas import ErrorDetail, HTTPErrorResponse
 from src.core.logging_config import setup_logging
 from src.database import execute_db_query, fetch_one_db
+from src.core.utils import utc_now_iso
 
 # ROOT_DIR in server.py refers to the 'backend/' directory.
 # settings.PROJECT_ROOT_DIR refers to the directory containing 'backend/'.
@@ -171,7 +172,7 @@ async def websocket_autonomous_data_endpoint(websocket: WebSocket):
             "market_open": app_state.system_status.market_open,
             "truedata_connected": app_state.market_data.truedata_connected,
             "zerodha_connected": app_state.market_data.zerodha_data_connected,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now_iso()
         }
         await websocket.send_text(json.dumps(initial_data))
         
@@ -182,10 +183,10 @@ async def websocket_autonomous_data_endpoint(websocket: WebSocket):
                 
                 # Handle ping/pong for keep-alive
                 if data == '{"type":"ping"}':
-                    await websocket.send_text('{"type":"pong","timestamp":"' + datetime.utcnow().isoformat() + '"}')
+                    await websocket.send_text('{"type":"pong","timestamp":"' + utc_now_iso() + '"}')
                 else:
                     # Echo other messages for now
-                    await websocket.send_text(f'{{"type":"echo","message":"Received: {data}","timestamp":"{datetime.utcnow().isoformat()}"}}')
+                    await websocket.send_text(f'{{"type":"echo","message":"Received: {data}","timestamp":"{utc_now_iso()}"}}')
             except Exception as recv_error:
                 logger_server.debug(f"WebSocket receive error: {recv_error}")
                 break
@@ -7,13 +7,15 @@ from pathlib import Path
 import asyncio
 import json
 from datetime import datetime, time, timedelta
+from time import monotonic
 import asyncpg
 import redis.asyncio as redis
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
 from pydantic import BaseModel, Field
 import uuid
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+import weakref
+from dataclasses import dataclass, field
+import pytz
 import websockets
 import aiohttp
 import numpy as np
@@ -41,6 +43,12 @@ TRUEDATA_PORT = int(os.environ.get('TRUEDATA_PORT', 8086))
 PAPER_TRADING = os.environ.get('PAPER_TRADING', 'true').lower() == 'true'
 AUTONOMOUS_TRADING_ENABLED = os.environ.get('AUTONOMOUS_TRADING_ENABLED', 'true').lower() == 'true'
 DAILY_STOP_LOSS_PERCENT = 2.0
+SQUARE_OFF_CONCURRENCY = 10  # Broker concurrent-order limit
+IST = pytz.timezone('Asia/Kolkata')
+
+# Strategy signal codes: strategies return (action_code, confidence)
+ACTION_BUY = 1
+ACTION_SELL = -1
 
 # Create the main app
 app = FastAPI(title="Autonomous Algo Trading Platform", version="1.0.0")
@@ -94,8 +102,8 @@ logger = logging.getLogger(__name__)
 db_pool = None
 redis_client = None
 kite = None
-scheduler = AsyncIOScheduler()
-websocket_connections = set()
+background_tasks: List[asyncio.Task] = []
+websocket_connections: 'weakref.WeakSet[WebSocket]' = weakref.WeakSet()
 active_strategies = {}
 strategy_instances = {}  # Store advanced strategy instances
 daily_pnl = 0.0
@@ -138,14 +146,27 @@ class Position(BaseModel):
     pnl: float
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
-class MarketTick(BaseModel):
+@dataclass(slots=True)
+class FastTick:
+    """Mutable in-process tick; one instance per symbol, no per-tick validation"""
     symbol: str
-    ltp: float
-    volume: int
-    bid: float
-    ask: float
-    oi: int
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    ltp: float = 0.0
+    volume: int = 0
+    bid: float = 0.0
+    ask: float = 0.0
+    oi: int = 0
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    
+    def as_dict(self) -> Dict:
+        return {
+            "symbol": self.symbol,
+            "ltp": self.ltp,
+            "volume": self.volume,
+            "bid": self.bid,
+            "ask": self.ask,
+            "oi": self.oi,
+            "timestamp": self.timestamp.isoformat()
+        }
 
 # Database initialization
 async def init_database():
@@ -190,6 +211,18 @@ async def init_database():
                 )
             """)
             
+            # Databases created before the unique index may hold duplicate
+            # names; keep the lowest id per name so the index can be built
+            await conn.execute("""
+                DELETE FROM strategies a USING strategies b
+                WHERE a.name = b.name AND a.id > b.id
+            """)
+            
+            await conn.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_strategies_name
+                ON strategies (name)
+            """)
+            
             await conn.execute("""
                 CREATE TABLE IF NOT EXISTS trades (
                     id VARCHAR PRIMARY KEY,
@@ -215,6 +248,12 @@ async def init_database():
                 )
             """)
             
+            # Covering index so the daily P&L sum is answered index-only
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_positions_timestamp_pnl
+                ON positions (timestamp) INCLUDE (pnl)
+            """)
+            
         logger.info("Database initialized successfully")
         
     except Exception as e:
@@ -252,9 +291,9 @@ class TradingStrategies:
             
             # Crossover detection
             if prev_short_ma <= prev_long_ma and short_ma > long_ma:
-                return {"action": "BUY", "confidence": 0.8}
+                return (ACTION_BUY, 0.8)
             elif prev_short_ma >= prev_long_ma and short_ma < long_ma:
-                return {"action": "SELL", "confidence": 0.8}
+                return (ACTION_SELL, 0.8)
                 
             return None
         except Exception as e:
@@ -292,9 +331,9 @@ class TradingStrategies:
             rsi = 100 - (100 / (1 + rs))
             
             if rsi < oversold:
-                return {"action": "BUY", "confidence": 0.75}
+                return (ACTION_BUY, 0.75)
             elif rsi > overbought:
-                return {"action": "SELL", "confidence": 0.75}
+                return (ACTION_SELL, 0.75)
                 
             return None
         except Exception as e:
@@ -315,9 +354,9 @@ class TradingStrategies:
             current_price = prices[-1]
             
             if current_price > recent_high * 1.02:  # 2% breakout
-                return {"action": "BUY", "confidence": 0.9}
+                return (ACTION_BUY, 0.9)
             elif current_price < recent_low * 0.98:  # 2% breakdown
-                return {"action": "SELL", "confidence": 0.9}
+                return (ACTION_SELL, 0.9)
                 
             return None
         except Exception as e:
@@ -340,9 +379,9 @@ class TradingStrategies:
             z_score = (current_price - mean_price) / std_price
             
             if z_score < -threshold:
-                return {"action": "BUY", "confidence": 0.7}
+                return (ACTION_BUY, 0.7)
             elif z_score > threshold:
-                return {"action": "SELL", "confidence": 0.7}
+                return (ACTION_SELL, 0.7)
                 
             return None
         except Exception as e:
@@ -369,9 +408,9 @@ class TradingStrategies:
                 # High volume, check price direction
                 price_change = await get_price_change_percent(symbol, 5)
                 if price_change > 1:
-                    return {"action": "BUY", "confidence": 0.8}
+                    return (ACTION_BUY, 0.8)
                 elif price_change < -1:
-                    return {"action": "SELL", "confidence": 0.8}
+                    return (ACTION_SELL, 0.8)
                     
             return None
         except Exception as e:
@@ -395,15 +434,35 @@ class TradingStrategies:
             current_price = prices[-1]
             
             if current_price < lower_band:
-                return {"action": "BUY", "confidence": 0.8}
+                return (ACTION_BUY, 0.8)
             elif current_price > upper_band:
-                return {"action": "SELL", "confidence": 0.8}
+                return (ACTION_SELL, 0.8)
                 
             return None
         except Exception as e:
             logger.error(f"Bollinger Bands error for {symbol}: {e}")
             return None
 
+# Main F&O symbols and the strategy dispatch table, resolved once at import
+SYMBOLS: Tuple[str, ...] = ("NIFTY", "BANKNIFTY", "FINNIFTY")
+STRATEGY_FNS: Tuple[Tuple[str, Callable], ...] = (
+    ("MA_Crossover", TradingStrategies.moving_average_crossover),
+    ("RSI", TradingStrategies.rsi_strategy),
+    ("Breakout", TradingStrategies.breakout_strategy),
+    ("Mean_Reversion", TradingStrategies.mean_reversion_strategy),
+    ("Volume_Breakout", TradingStrategies.volume_breakout_strategy),
+    ("Bollinger_Bands", TradingStrategies.bollinger_bands_strategy),
+)
+
+async def run_strategies(symbol: str) -> List:
+    """Run every strategy in STRATEGY_FNS for symbol and collect the signals"""
+    strategy_results = []
+    for name, strategy_fn in STRATEGY_FNS:
+        result = await strategy_fn(symbol)
+        if result:
+            strategy_results.append((name, result))
+    return strategy_results
+
 # Helper functions
 async def get_historical_prices(symbol: str, periods: int) -> List[float]:
     """Get historical prices from cache or external source"""
@@ -808,37 +867,53 @@ async def auto_square_off():
                 logger.info("No open positions to square off")
                 return
             
-            for position in positions:
-                try:
-                    # Create square-off order
-                    square_off_result = await create_square_off_order(
-                        position['position_id'],
-                        position['symbol'],
-                        position['quantity'],
-                        'AUTO_SQUARE_OFF'
-                    )
-                    
-                    if square_off_result['success']:
-                        logger.info(f"✅ Auto squared off {position['symbol']} - Position: {position['position_id']}")
-                    else:
-                        logger.error(f"❌ Failed to square off {position['symbol']}: {square_off_result}")
-                        
-                except Exception as e:
-                    logger.error(f"Error squaring off position {position['position_id']}: {e}")
+        # Bound in-flight broker calls to the concurrent-order limit
+        semaphore = asyncio.Semaphore(SQUARE_OFF_CONCURRENCY)
         
+        async def square_off_position(position):
+            async with semaphore:
+                return await create_square_off_order(
+                    position['position_id'],
+                    position['symbol'],
+                    position['quantity'],
+                    'AUTO_SQUARE_OFF'
+                )
+        
+        results = await asyncio.gather(
+            *[square_off_position(position) for position in positions],
+            return_exceptions=True
+        )
+        
+        succeeded = 0
+        for position, result in zip(positions, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error squaring off position {position['position_id']}: {result}")
+            elif result.get('success'):
+                succeeded += 1
+            else:
+                logger.error(f"❌ Failed to square off {position['symbol']}: {result}")
+        
+        logger.info(f"✅ Auto squared off {succeeded}/{len(positions)} positions")
         logger.info("Auto square-off completed")
         
     except Exception as e:
         logger.error(f"Error in auto square-off: {e}")
 
 # Daily P&L monitoring and stop loss
+# Start of the current IST trading day as an absolute time, computed by the
+# database: positions.timestamp is a naive TIMESTAMP in the session's time
+# zone, which Postgres resolves when comparing it with this timestamptz
+IST_DAY_START_SQL = "date_trunc('day', now() AT TIME ZONE 'Asia/Kolkata') AT TIME ZONE 'Asia/Kolkata'"
+
 async def check_daily_stop_loss():
     """Check if daily stop loss is hit"""
     try:
         global daily_pnl
         
         async with db_pool.acquire() as conn:
-            result = await conn.fetchval("SELECT SUM(pnl) FROM positions")
+            result = await conn.fetchval(
+                f"SELECT COALESCE(SUM(pnl), 0) FROM positions WHERE timestamp >= {IST_DAY_START_SQL}"
+            )
             daily_pnl = result or 0.0
             
             # Get user's risk capital (assuming $100,000 for now)
@@ -881,9 +956,7 @@ async def execute_strategies():
         async with db_pool.acquire() as conn:
             strategies = await conn.fetch("SELECT * FROM strategies WHERE is_active = TRUE")
             
-        symbols = ["NIFTY", "BANKNIFTY", "FINNIFTY"]  # Main F&O symbols
-        
-        for symbol in symbols:
+        for symbol in SYMBOLS:
             if symbol not in market_data:
                 continue
                 
@@ -900,38 +973,7 @@ async def execute_strategies():
             
             # Execute each advanced strategy
             try:
-                # Execute all 6 strategies
-                strategy_results = []
-                
-                # Strategy 1: Moving Average Crossover
-                ma_result = await TradingStrategies.moving_average_crossover(symbol)
-                if ma_result:
-                    strategy_results.append(("MA_Crossover", ma_result))
-                
-                # Strategy 2: RSI
-                rsi_result = await TradingStrategies.rsi_strategy(symbol)
-                if rsi_result:
-                    strategy_results.append(("RSI", rsi_result))
-                
-                # Strategy 3: Breakout
-                breakout_result = await TradingStrategies.breakout_strategy(symbol)
-                if breakout_result:
-                    strategy_results.append(("Breakout", breakout_result))
-                
-                # Strategy 4: Mean Reversion
-                mr_result = await TradingStrategies.mean_reversion_strategy(symbol)
-                if mr_result:
-                    strategy_results.append(("Mean_Reversion", mr_result))
-                
-                # Strategy 5: Volume Breakout
-                vol_result = await TradingStrategies.volume_breakout_strategy(symbol)
-                if vol_result:
-                    strategy_results.append(("Volume_Breakout", vol_result))
-                
-                # Strategy 6: Bollinger Bands
-                bb_result = await TradingStrategies.bollinger_bands_strategy(symbol)
-                if bb_result:
-                    strategy_results.append(("Bollinger_Bands", bb_result))
+                strategy_results = await run_strategies(symbol)
                 
             except Exception as e:
                 logger.error(f"Error executing advanced strategy for {symbol}: {e}")
@@ -951,44 +993,12 @@ async def execute_basic_strategies():
         async with db_pool.acquire() as conn:
             strategies = await conn.fetch("SELECT * FROM strategies WHERE is_active = TRUE")
             
-        symbols = ["NIFTY", "BANKNIFTY", "FINNIFTY"]  # Main F&O symbols
-        
-        for symbol in symbols:
+        for symbol in SYMBOLS:
             if symbol not in market_data:
                 continue
                 
             # Execute all 6 basic strategies
-            strategy_results = []
-            
-            # Strategy 1: Moving Average Crossover
-            ma_result = await TradingStrategies.moving_average_crossover(symbol)
-            if ma_result:
-                strategy_results.append(("MA_Crossover", ma_result))
-            
-            # Strategy 2: RSI
-            rsi_result = await TradingStrategies.rsi_strategy(symbol)
-            if rsi_result:
-                strategy_results.append(("RSI", rsi_result))
-            
-            # Strategy 3: Breakout
-            breakout_result = await TradingStrategies.breakout_strategy(symbol)
-            if breakout_result:
-                strategy_results.append(("Breakout", breakout_result))
-            
-            # Strategy 4: Mean Reversion
-            mr_result = await TradingStrategies.mean_reversion_strategy(symbol)
-            if mr_result:
-                strategy_results.append(("Mean_Reversion", mr_result))
-            
-            # Strategy 5: Volume Breakout
-            vol_result = await TradingStrategies.volume_breakout_strategy(symbol)
-            if vol_result:
-                strategy_results.append(("Volume_Breakout", vol_result))
-            
-            # Strategy 6: Bollinger Bands
-            bb_result = await TradingStrategies.bollinger_bands_strategy(symbol)
-            if bb_result:
-                strategy_results.append(("Bollinger_Bands", bb_result))
+            strategy_results = await run_strategies(symbol)
             
             # Consensus decision making
             if strategy_results:
@@ -1000,18 +1010,24 @@ async def execute_basic_strategies():
 async def make_trading_decision(symbol: str, strategy_results: List):
     """Make final trading decision based on multiple strategy signals"""
     try:
-        buy_signals = [r for r in strategy_results if r[1]["action"] == "BUY"]
-        sell_signals = [r for r in strategy_results if r[1]["action"] == "SELL"]
+        count = len(strategy_results)
+        actions = np.fromiter((r[1][0] for r in strategy_results), dtype=np.int8, count=count)
+        # float64 so the sums round exactly like the scalar ones did; float32 would
+        # break ties such as 0.9+0.7 vs 0.8+0.8 and turn "no trade" into a trade
+        confidences = np.fromiter((r[1][1] for r in strategy_results), dtype=np.float64, count=count)
+        
+        buy_mask = actions == ACTION_BUY
+        sell_mask = actions == ACTION_SELL
         
         # Simple majority voting with confidence weighting
-        buy_confidence = sum([r[1]["confidence"] for r in buy_signals])
-        sell_confidence = sum([r[1]["confidence"] for r in sell_signals])
+        buy_confidence = float(confidences[buy_mask].sum())
+        sell_confidence = float(confidences[sell_mask].sum())
         
         decision_threshold = 1.5  # Require decent confidence
         
         if buy_confidence > decision_threshold and buy_confidence > sell_confidence:
             # Execute BUY
-            avg_confidence = buy_confidence / len(buy_signals)
+            avg_confidence = buy_confidence / int(buy_mask.sum())
             quantity = await calculate_position_size(symbol, avg_confidence, 50000.0)
             
             if quantity > 0:
@@ -1020,7 +1036,7 @@ async def make_trading_decision(symbol: str, strategy_results: List):
                 
         elif sell_confidence > decision_threshold and sell_confidence > buy_confidence:
             # Execute SELL
-            avg_confidence = sell_confidence / len(sell_signals)
+            avg_confidence = sell_confidence / int(sell_mask.sum())
             quantity = await calculate_position_size(symbol, avg_confidence, 50000.0)
             
             if quantity > 0:
@@ -1033,31 +1049,28 @@ async def make_trading_decision(symbol: str, strategy_results: List):
 # WebSocket management
 async def broadcast_message(message: Dict):
     """Broadcast message to all connected WebSocket clients"""
-    if websocket_connections:
-        disconnected = set()
-        for websocket in websocket_connections:
-            try:
-                await websocket.send_text(json.dumps(message))
-            except:
-                disconnected.add(websocket)
-        
-        # Remove disconnected clients
-        websocket_connections -= disconnected
+    if not websocket_connections:
+        return
+    
+    payload = json.dumps(message)
+    
+    # Iterate a snapshot so disconnect handlers can mutate the set meanwhile
+    targets = list(websocket_connections)
+    results = await asyncio.gather(
+        *[websocket.send_text(payload) for websocket in targets],
+        return_exceptions=True
+    )
+    
+    for websocket, result in zip(targets, results):
+        if isinstance(result, Exception):
+            websocket_connections.discard(websocket)
 
-# WebSocket management
-async def broadcast_message(message: Dict):
-    """Broadcast message to all connected WebSocket clients"""
-    global websocket_connections
-    if websocket_connections:
-        disconnected = set()
-        for websocket in websocket_connections:
-            try:
-                await websocket.send_text(json.dumps(message))
-            except:
-                disconnected.add(websocket)
-        
-        # Remove disconnected clients
-        websocket_connections -= disconnected
+async def broadcast_heartbeat():
+    """Send one heartbeat to every connected WebSocket client"""
+    await broadcast_message({
+        "type": "heartbeat",
+        "timestamp": datetime.utcnow().isoformat()
+    })
 
 # API Routes
 @api_router.get("/")
@@ -1153,7 +1166,6 @@ async def square_off_all_positions():
 @api_router.websocket("/ws/market-data")
 async def websocket_market_data(websocket: WebSocket):
     """WebSocket endpoint for real-time market data"""
-    global websocket_connections
     await websocket.accept()
     websocket_connections.add(websocket)
     
@@ -1171,31 +1183,15 @@ async def websocket_market_data(websocket: WebSocket):
         initial_data = {
             "type": "initial_data",
             "positions": current_positions,
-            "market_data": {
-                k: {
-                    "symbol": v.symbol,
-                    "ltp": v.ltp,
-                    "volume": v.volume,
-                    "bid": v.bid,
-                    "ask": v.ask,
-                    "oi": v.oi,
-                    "timestamp": v.timestamp.isoformat()
-                } for k, v in market_data.items()
-            },
+            "market_data": {k: v.as_dict() for k, v in market_data.items()},
             "daily_pnl": daily_pnl
         }
         
         await websocket.send_text(json.dumps(initial_data))
         
-        # Keep connection alive
+        # Heartbeats come from the shared broadcast task; just wait for disconnect
         while True:
-            await asyncio.sleep(5)
-            # Send periodic heartbeat
-            heartbeat = {
-                "type": "heartbeat",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            await websocket.send_text(json.dumps(heartbeat))
+            await websocket.receive_text()
             
     except WebSocketDisconnect:
         websocket_connections.discard(websocket)
@@ -1207,13 +1203,11 @@ async def websocket_market_data(websocket: WebSocket):
 # Mock TrueData feed simulation
 async def simulate_market_data():
     """Simulate real-time market data (replace with actual TrueData integration)"""
-    global websocket_connections
-    symbols = ["NIFTY", "BANKNIFTY", "FINNIFTY"]
     base_prices = {"NIFTY": 19500, "BANKNIFTY": 45000, "FINNIFTY": 19000}
     
     while True:
         try:
-            for symbol in symbols:
+            for symbol in SYMBOLS:
                 # Simulate price movements
                 if symbol not in market_data:
                     price = base_prices[symbol]
@@ -1222,30 +1216,21 @@ async def simulate_market_data():
                     change = np.random.normal(0, 0.002)  # 0.2% volatility
                     price = last_price * (1 + change)
                 
-                # Create market tick
-                tick = MarketTick(
-                    symbol=symbol,
-                    ltp=round(price, 2),
-                    volume=np.random.randint(10000, 100000),
-                    bid=round(price - 0.25, 2),
-                    ask=round(price + 0.25, 2),
-                    oi=np.random.randint(500000, 2000000)
-                )
-                
-                market_data[symbol] = tick
+                # Update the symbol's tick in place
+                tick = market_data.get(symbol)
+                if tick is None:
+                    tick = market_data[symbol] = FastTick(symbol)
+                tick.ltp = round(price, 2)
+                tick.volume = int(np.random.randint(10000, 100000))
+                tick.bid = round(price - 0.25, 2)
+                tick.ask = round(price + 0.25, 2)
+                tick.oi = int(np.random.randint(500000, 2000000))
+                tick.timestamp = datetime.utcnow()
                 
                 # Broadcast to clients
                 await broadcast_message({
                     "type": "market_tick",
-                    "data": {
-                        "symbol": tick.symbol,
-                        "ltp": tick.ltp,
-                        "volume": tick.volume,
-                        "bid": tick.bid,
-                        "ask": tick.ask,
-                        "oi": tick.oi,
-                        "timestamp": tick.timestamp.isoformat()
-                    }
+                    "data": tick.as_dict()
                 })
             
             await asyncio.sleep(1)  # Update every second
@@ -1255,33 +1240,54 @@ async def simulate_market_data():
             await asyncio.sleep(5)
 
 # Scheduler setup
+async def run_periodically(job, interval: float):
+    """Run job every interval seconds on a monotonic schedule"""
+    next_run = monotonic() + interval
+    while True:
+        await asyncio.sleep(max(0.0, next_run - monotonic()))
+        try:
+            await job()
+        except Exception as e:
+            logger.error(f"Error in periodic job {job.__name__}: {e}")
+        
+        # Skip missed runs instead of firing them back-to-back
+        next_run = max(next_run + interval, monotonic())
+
+def next_ist_occurrence(hour: int, minute: int, after: datetime) -> datetime:
+    """First hour:minute IST strictly after the given aware datetime"""
+    target = after.astimezone(IST).replace(hour=hour, minute=minute, second=0, microsecond=0)
+    while target <= after:
+        target += timedelta(days=1)
+    return target
+
+async def run_daily_ist(job, hour: int, minute: int):
+    """Run job once a day at hour:minute IST"""
+    target = next_ist_occurrence(hour, minute, datetime.now(IST))
+    while True:
+        # Sleep again if woken early, so a run never starts before its target
+        while (remaining := (target - datetime.now(IST)).total_seconds()) > 0:
+            await asyncio.sleep(remaining)
+        try:
+            await job()
+        except Exception as e:
+            logger.error(f"Error in daily job {job.__name__}: {e}")
+        
+        # Next target follows this one, never today's again; days missed are skipped
+        target = next_ist_occurrence(hour, minute, max(target, datetime.now(IST)))
+
 def setup_scheduler():
     """Setup scheduled tasks"""
     try:
-        # Auto square-off at 3:15 PM
-        scheduler.add_job(
-            auto_square_off,
-            CronTrigger(hour=15, minute=15, timezone='Asia/Kolkata'),
-            id='auto_square_off'
-        )
-        
-        # Strategy execution every 30 seconds during market hours
-        scheduler.add_job(
-            execute_strategies,
-            'interval',
-            seconds=30,
-            id='strategy_execution'
-        )
-        
-        # Stop loss check every 10 seconds
-        scheduler.add_job(
-            check_daily_stop_loss,
-            'interval',
-            seconds=10,
-            id='stop_loss_check'
-        )
-        
-        scheduler.start()
+        background_tasks.extend([
+            # Auto square-off at 3:15 PM
+            asyncio.create_task(run_daily_ist(auto_square_off, 15, 15)),
+            # Strategy execution every 30 seconds during market hours
+            asyncio.create_task(run_periodically(execute_strategies, 30)),
+            # Stop loss check every 10 seconds
+            asyncio.create_task(run_periodically(check_daily_stop_loss, 10)),
+            # WebSocket heartbeat every 5 seconds
+            asyncio.create_task(run_periodically(broadcast_heartbeat, 5)),
+        ])
         logger.info("Scheduler started with all jobs")
         
     except Exception as e:
@@ -1324,28 +1330,26 @@ async def init_default_strategies():
     ]
     
     try:
+        rows = []
+        for strategy_config in strategies:
+            strategy = Strategy(
+                name=strategy_config["name"],
+                description=strategy_config["description"],
+                parameters=strategy_config["parameters"],
+                is_active=True
+            )
+            rows.append((strategy.id, strategy.name, strategy.description,
+                         json.dumps(strategy.parameters), strategy.is_active))
+        
+        # Existing strategies are left untouched via the unique name index
         async with db_pool.acquire() as conn:
-            for strategy_config in strategies:
-                strategy = Strategy(
-                    name=strategy_config["name"],
-                    description=strategy_config["description"],
-                    parameters=strategy_config["parameters"],
-                    is_active=True
-                )
-                
-                # Check if strategy already exists
-                existing = await conn.fetchval(
-                    "SELECT id FROM strategies WHERE name = $1", strategy.name
-                )
-                
-                if not existing:
-                    await conn.execute("""
-                        INSERT INTO strategies (id, name, description, parameters, is_active)
-                        VALUES ($1, $2, $3, $4, $5)
-                    """, strategy.id, strategy.name, strategy.description,
-                        json.dumps(strategy.parameters), strategy.is_active)
-                    
-                    logger.info(f"Initialized strategy: {strategy.name}")
+            await conn.executemany("""
+                INSERT INTO strategies (id, name, description, parameters, is_active)
+                VALUES ($1, $2, $3, $4, $5)
+                ON CONFLICT (name) DO NOTHING
+            """, rows)
+        
+        logger.info(f"Ensured {len(rows)} default strategies exist")
         
     except Exception as e:
         logger.error(f"Error initializing default strategies: {e}")
@@ -1373,7 +1377,7 @@ async def startup_event():
         setup_scheduler()
         
         # Start market data simulation
-        asyncio.create_task(simulate_market_data())
+        background_tasks.append(asyncio.create_task(simulate_market_data()))
         
         logger.info("Platform started successfully!")
         
@@ -1385,8 +1389,10 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     try:
-        if scheduler.running:
-            scheduler.shutdown()
+        for task in background_tasks:
+            task.cancel()
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+        background_tasks.clear()
         
         if redis_client:
             await redis_client.close()
@@ -1401,4 +1407,13 @@ async def shutdown_event():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+
+    # uvloop ships with uvicorn[standard]; fall back to the stdlib loop if absent
+    try:
+        import uvloop
+        uvloop.install()
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "asyncio"
+
+    uvicorn.run(app, host="0.0.0.0", port=8001, loop=loop_impl)
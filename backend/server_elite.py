@@ -5,13 +5,16 @@ Comprehensive integration of all src/core components with elite trading system
 
 from fastapi import FastAPI, APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 import os
 import logging
 from pathlib import Path
 import asyncio
-import json
-from datetime import datetime, time, timedelta
+import contextlib
+from datetime import datetime, timedelta
+from functools import lru_cache
+from time import monotonic
 import asyncpg
 import redis.asyncio as redis
 from typing import List, Dict, Optional, Any
@@ -19,7 +22,9 @@ from pydantic import BaseModel, Field
 import uuid
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+import msgpack
 import numpy as np
+import orjson
 import pandas as pd
 
 ROOT_DIR = Path(__file__).parent
@@ -83,8 +88,18 @@ PAPER_TRADING = os.environ.get('PAPER_TRADING', 'true').lower() == 'true'
 AUTONOMOUS_TRADING_ENABLED = os.environ.get('AUTONOMOUS_TRADING_ENABLED', 'true').lower() == 'true'
 DAILY_STOP_LOSS_PERCENT = 2.0
 
+# orjson handles numpy scalars and naive datetimes natively
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+# Shared PCG64 generator for mock market data
+RNG = np.random.default_rng()
+
 # Create FastAPI application
-app = FastAPI(title="Elite Autonomous Algo Trading Platform", version="2.0.0")
+app = FastAPI(
+    title="Elite Autonomous Algo Trading Platform",
+    version="2.0.0",
+    default_response_class=ORJSONResponse
+)
 api_router = APIRouter(prefix="/api")
 
 # CORS middleware
@@ -99,13 +114,24 @@ app.add_middleware(
 # Global variables
 db_pool = None
 redis_client = None
-scheduler = AsyncIOScheduler()
-websocket_connections = set()
+# Coalesce missed runs and never stack a job behind a slow iteration of itself
+scheduler = AsyncIOScheduler(job_defaults={
+    'coalesce': True,
+    'max_instances': 1,
+    'misfire_grace_time': 10
+})
+websocket_connections: Dict[WebSocket, "WSClient"] = {}
+
+# Monotonic time of the last successful SELECT 1 database probe
+DB_PROBE_INTERVAL = 300
+last_db_probe = float('-inf')
 
 # Elite trading components
 elite_engine = None
 analyzers = {}
 strategy_instances = {}
+# Snapshot of strategy_instances.values(), refreshed when strategies are registered
+registered_strategies: tuple = ()
 
 # System state
 system_state = {
@@ -116,8 +142,52 @@ system_state = {
     'active_positions': {},
     'market_data': {},
     'system_health': 'HEALTHY',
+    'enabled_strategy_count': 0,
     'start_time': datetime.utcnow()
 }
+start_monotonic = monotonic()  # Uptime reference, immune to wall-clock jumps
+
+# Outbound frames buffered per WebSocket client before it is disconnected
+WS_QUEUE_SIZE = 32
+# Clients queued per event-loop step during a broadcast
+WS_BROADCAST_BATCH = 50
+
+class WSClient:
+    """WebSocket client with a bounded outbound queue drained by its own writer task"""
+    __slots__ = ('ws', 'queue', 'task')
+    
+    def __init__(self, ws: WebSocket):
+        self.ws = ws
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=WS_QUEUE_SIZE)
+        self.task = asyncio.create_task(self._drain())
+    
+    async def _drain(self):
+        # Frames go out as text: the dashboard reads them with
+        # JSON.parse(event.data), and a binary frame would arrive as a Blob
+        try:
+            while True:
+                payload = await self.queue.get()
+                await self.ws.send_text(payload)
+                # Flush whatever queued up during the send without a
+                # separate wake-up per frame
+                while not self.queue.empty():
+                    await self.ws.send_text(self.queue.get_nowait())
+        except Exception as e:
+            logger.debug(f"WebSocket writer stopped: {e}")
+            websocket_connections.pop(self.ws, None)
+    
+    def send(self, payload: str):
+        """Queue payload without blocking; a client whose queue is full is dropped"""
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning("WebSocket client too slow, disconnecting")
+            self.close()
+    
+    def close(self):
+        """Unregister the client and stop its writer"""
+        websocket_connections.pop(self.ws, None)
+        self.task.cancel()
 
 # Pydantic models for API
 class SystemStatus(BaseModel):
@@ -158,24 +228,9 @@ class EliteRecommendationResponse(BaseModel):
 # Database operations
 async def init_database():
     """Initialize database connections"""
-    global db_pool, redis_client
-    
     try:
-        # PostgreSQL connection
-        if DATABASE_URL:
-            db_pool = await asyncpg.create_pool(
-                DATABASE_URL,
-                min_size=3,
-                max_size=10,
-                command_timeout=60
-            )
-            logger.info("PostgreSQL database connected")
-        
-        # Redis connection  
-        if REDIS_URL:
-            redis_client = redis.from_url(REDIS_URL)
-            await redis_client.ping()
-            logger.info("Redis cache connected")
+        # PostgreSQL and Redis are independent, so connect to both at once
+        await asyncio.gather(connect_postgres(), connect_redis())
         
         # Create database schema
         await create_database_schema()
@@ -184,6 +239,47 @@ async def init_database():
         logger.error(f"Database initialization error: {e}")
         raise
 
+async def connect_postgres():
+    """Create the PostgreSQL connection pool"""
+    global db_pool
+    
+    if DATABASE_URL:
+        # Sized for the scheduler jobs plus concurrent API/WebSocket handlers;
+        # hot INSERTs stay prepared via the per-connection statement cache
+        db_pool = await asyncpg.create_pool(
+            DATABASE_URL,
+            min_size=10,
+            max_size=50,
+            max_inactive_connection_lifetime=300,
+            statement_cache_size=1024,
+            max_cached_statement_lifetime=0,
+            command_timeout=10,
+            server_settings={
+                'jit': 'off',
+                'application_name': 'algo-elite'
+            }
+        )
+        logger.info("PostgreSQL database connected")
+
+async def connect_redis():
+    """Create the Redis client and verify the connection"""
+    global redis_client
+    
+    if REDIS_URL:
+        redis_pool = redis.ConnectionPool.from_url(
+            REDIS_URL,
+            max_connections=32,
+            decode_responses=False
+        )
+        redis_client = redis.Redis(connection_pool=redis_pool)
+        await redis_client.ping()
+        logger.info("Redis cache connected")
+
+async def close_redis():
+    """Close the Redis client and its explicit connection pool"""
+    await redis_client.close()
+    await redis_client.connection_pool.disconnect()
+
 async def create_database_schema():
     """Create or update database schema"""
     if not db_pool:
@@ -241,6 +337,128 @@ async def create_database_schema():
     except Exception as e:
         logger.error(f"Error creating database schema: {e}")
 
+# Hot-path INSERTs; kept byte-identical so each pooled connection's
+# statement cache prepares them once and reuses the plan
+INSERT_ELITE_RECOMMENDATION_SQL = """
+    INSERT INTO elite_recommendations (
+        id, symbol, strategy, direction, entry_price,
+        stop_loss, primary_target, confidence_score,
+        timeframe, valid_until, metadata
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+    ON CONFLICT (id) DO NOTHING
+"""
+
+INSERT_STRATEGY_SIGNAL_SQL = """
+    INSERT INTO strategy_performance (
+        id, strategy_name, symbol, action, entry_price
+    ) VALUES ($1, $2, $3, $4, $5)
+"""
+
+# system_metrics rows are buffered here and written with COPY in bulk
+METRICS_FLUSH_INTERVAL = 5
+metrics_queue: asyncio.Queue = asyncio.Queue()
+metrics_flush_task = None
+
+def log_metric(name: str, value: float):
+    """Buffer a metric for the next system_metrics flush"""
+    metrics_queue.put_nowait((name, float(value)))
+
+async def flush_metrics():
+    """Write all buffered metrics to system_metrics with a single COPY"""
+    records = []
+    while not metrics_queue.empty():
+        records.append(metrics_queue.get_nowait())
+    
+    if not records or not db_pool:
+        return
+    
+    try:
+        async with db_pool.acquire() as conn:
+            await conn.copy_records_to_table(
+                'system_metrics',
+                records=records,
+                columns=('metric_name', 'metric_value')
+            )
+    except asyncio.CancelledError:
+        # Cancelled mid-write (shutdown): put the rows back for the final flush
+        for record in records:
+            metrics_queue.put_nowait(record)
+        raise
+
+async def metrics_flush_loop():
+    """Flush buffered metrics every METRICS_FLUSH_INTERVAL seconds"""
+    while True:
+        await asyncio.sleep(METRICS_FLUSH_INTERVAL)
+        try:
+            await flush_metrics()
+        except Exception as e:
+            logger.error(f"Error flushing system metrics: {e}")
+
+async def batch_insert(sql: str, rows: List[tuple]):
+    """Insert rows with a single executemany round-trip"""
+    if not rows or not db_pool:
+        return
+    
+    async with db_pool.acquire() as conn:
+        await conn.executemany(sql, rows)
+
+# Mock data provider for demonstration
+MOCK_MAX_PERIODS = 500
+MOCK_DATES = pd.date_range(start='2023-01-01', periods=MOCK_MAX_PERIODS, freq='1min')
+
+@lru_cache(maxsize=64)
+def generate_mock_ohlcv(symbol: str, timeframe: str, periods: int, minute_bucket: int) -> pd.DataFrame:
+    """Generate realistic OHLCV data; cached per minute bucket"""
+    if periods <= MOCK_MAX_PERIODS:
+        dates = MOCK_DATES[:periods]
+    else:
+        dates = pd.date_range(start='2023-01-01', periods=periods, freq='1min')
+    
+    # Generate realistic OHLCV data
+    base_price = 19000 if 'NIFTY' in symbol else 45000 if 'BANK' in symbol else 19000
+    
+    # Random walk with some trend
+    returns = RNG.normal(0, 0.001, periods)  # 0.1% volatility
+    prices = base_price * np.cumprod(1 + returns)
+    
+    # Create OHLC from prices
+    high = prices * (1 + RNG.uniform(0, 0.01, periods))
+    low = prices * (1 - RNG.uniform(0, 0.01, periods))
+    open_prices = np.empty_like(prices)
+    open_prices[0] = prices[0]
+    open_prices[1:] = prices[:-1]
+    
+    return pd.DataFrame({
+        'open': open_prices,
+        'high': high,
+        'low': low,
+        'close': prices,
+        'volume': RNG.integers(1000, 10000, periods)
+    }, index=dates)
+
+class EliteDataProvider:
+    """Stateless mock market data source for the elite recommendation engine"""
+    __slots__ = ()
+    
+    async def get_historical_data(self, symbol, timeframe, periods):
+        """Generate realistic market data for analysis"""
+        return generate_mock_ohlcv(symbol, timeframe, periods, int(monotonic() // 60))
+    
+    async def get_order_book(self, symbol):
+        return {"bids": [], "asks": []}
+    
+    async def get_recent_trades(self, symbol):
+        return []
+    
+    async def get_option_chain(self, symbol, expiry):
+        return pd.DataFrame()
+    
+    async def get_market_breadth(self):
+        return {"advance_decline_ratio": 1.2, "new_highs": 150, "new_lows": 50}
+    
+    async def get_vix_data(self):
+        return {"current": 18, "ma_20": 16}
+
 # Elite trading system initialization
 async def initialize_elite_trading_system():
     """Initialize elite trading recommendation system"""
@@ -257,50 +475,6 @@ async def initialize_elite_trading_system():
             'smart_money': SmartMoneyAnalyzer()
         }
         
-        # Mock data provider for demonstration
-        class EliteDataProvider:
-            async def get_historical_data(self, symbol, timeframe, periods):
-                """Generate realistic market data for analysis"""
-                dates = pd.date_range(start='2023-01-01', periods=periods, freq='1min')
-                
-                # Generate realistic OHLCV data
-                base_price = 19000 if 'NIFTY' in symbol else 45000 if 'BANK' in symbol else 19000
-                
-                # Random walk with some trend
-                returns = np.random.normal(0, 0.001, periods)  # 0.1% volatility
-                prices = base_price * np.cumprod(1 + returns)
-                
-                # Create OHLC from prices
-                high = prices * (1 + np.random.uniform(0, 0.01, periods))
-                low = prices * (1 - np.random.uniform(0, 0.01, periods))
-                open_prices = np.roll(prices, 1)
-                open_prices[0] = prices[0]
-                
-                data = pd.DataFrame({
-                    'open': open_prices,
-                    'high': high,
-                    'low': low,
-                    'close': prices,
-                    'volume': np.random.randint(1000, 10000, periods)
-                }, index=dates)
-                
-                return data
-            
-            async def get_order_book(self, symbol):
-                return {"bids": [], "asks": []}
-            
-            async def get_recent_trades(self, symbol):
-                return []
-            
-            async def get_option_chain(self, symbol, expiry):
-                return pd.DataFrame()
-            
-            async def get_market_breadth(self):
-                return {"advance_decline_ratio": 1.2, "new_highs": 150, "new_lows": 50}
-            
-            async def get_vix_data(self):
-                return {"current": 18, "ma_20": 16}
-        
         # Initialize elite recommendation engine
         elite_engine = EliteRecommendationEngine(
             data_provider=EliteDataProvider(),
@@ -319,7 +493,7 @@ async def initialize_elite_trading_system():
 
 async def initialize_trading_strategies():
     """Initialize all trading strategies"""
-    global strategy_instances
+    global strategy_instances, registered_strategies
     
     if not CORE_COMPONENTS_AVAILABLE:
         logger.warning("Core components not available, skipping strategy initialization")
@@ -366,6 +540,10 @@ async def initialize_trading_strategies():
                 
                 # Create strategy instance
                 strategy_instance = strategy_class(config)
+                # Every registered strategy carries is_enabled so the hot
+                # paths can read it directly
+                if not hasattr(strategy_instance, 'is_enabled'):
+                    strategy_instance.is_enabled = True
                 strategy_instances[strategy_name] = strategy_instance
                 
                 logger.info(f"Strategy initialized: {strategy_name}")
@@ -373,6 +551,10 @@ async def initialize_trading_strategies():
             except Exception as e:
                 logger.error(f"Error initializing strategy {strategy_name}: {e}")
         
+        registered_strategies = tuple(strategy_instances.values())
+        system_state['enabled_strategy_count'] = sum(
+            1 for s in registered_strategies if s.is_enabled
+        )
         logger.info(f"Initialized {len(strategy_instances)} trading strategies")
         
     except Exception as e:
@@ -382,12 +564,16 @@ async def initialize_trading_strategies():
 def setup_scheduler():
     """Setup scheduled tasks"""
     try:
+        # First runs start shortly after boot instead of one full interval later
+        first_run = datetime.now() + timedelta(seconds=5)
+        
         # Elite recommendations scan every 5 minutes
         scheduler.add_job(
             scan_elite_recommendations,
             'interval',
             seconds=300,
-            id='elite_scan'
+            id='elite_scan',
+            next_run_time=first_run
         )
         
         # System health check every minute
@@ -395,7 +581,8 @@ def setup_scheduler():
             system_health_check,
             'interval',
             seconds=60,
-            id='health_check'
+            id='health_check',
+            next_run_time=first_run
         )
         
         # Strategy execution every 30 seconds during market hours
@@ -404,7 +591,8 @@ def setup_scheduler():
                 execute_strategy_loop,
                 'interval',
                 seconds=30,
-                id='strategy_execution'
+                id='strategy_execution',
+                next_run_time=first_run
             )
         
         scheduler.start()
@@ -425,23 +613,18 @@ async def scan_elite_recommendations():
         if recommendations:
             logger.info(f"Found {len(recommendations)} elite trade opportunities")
             
-            # Store recommendations in database
+            # Store recommendations in database in one batch
             if db_pool:
-                async with db_pool.acquire() as conn:
-                    for rec in recommendations:
-                        await conn.execute("""
-                            INSERT INTO elite_recommendations (
-                                id, symbol, strategy, direction, entry_price,
-                                stop_loss, primary_target, confidence_score,
-                                timeframe, valid_until, metadata
-                            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-                            ON CONFLICT (id) DO NOTHING
-                        """, 
-                        rec.recommendation_id, rec.symbol, rec.strategy,
-                        rec.direction, rec.entry_price, rec.stop_loss,
-                        rec.primary_target, rec.confidence_score,
-                        rec.timeframe, rec.valid_until,
-                        json.dumps(rec.__dict__, default=str))
+                rows = [
+                    (rec.recommendation_id, rec.symbol, rec.strategy,
+                     rec.direction, rec.entry_price, rec.stop_loss,
+                     rec.primary_target, rec.confidence_score,
+                     rec.timeframe, rec.valid_until,
+                     orjson.dumps(rec.__dict__, default=str,
+                                  option=ORJSON_OPTIONS).decode())
+                    for rec in recommendations
+                ]
+                await batch_insert(INSERT_ELITE_RECOMMENDATION_SQL, rows)
             
             # Broadcast to websocket clients
             await broadcast_elite_recommendations(recommendations)
@@ -451,6 +634,8 @@ async def scan_elite_recommendations():
 
 async def system_health_check():
     """Perform system health check"""
+    global last_db_probe
+    
     try:
         health_status = {}
         
@@ -458,19 +643,29 @@ async def system_health_check():
         health_status['elite_engine'] = 'HEALTHY' if elite_engine else 'NOT_INITIALIZED'
         health_status['strategies'] = 'HEALTHY' if strategy_instances else 'NOT_INITIALIZED'
         
-        # Check database connections
+        # Check database connections from pool state; only run a real
+        # SELECT 1 every DB_PROBE_INTERVAL seconds
         if db_pool:
-            try:
-                async with db_pool.acquire() as conn:
-                    await conn.fetchval("SELECT 1")
-                health_status['database'] = 'HEALTHY'
-            except:
-                health_status['database'] = 'UNHEALTHY'
+            pool_ok = not db_pool.is_closing() and db_pool.get_size() > 0
+            health_status['database'] = 'HEALTHY' if pool_ok else 'UNHEALTHY'
+            
+            if pool_ok and monotonic() - last_db_probe >= DB_PROBE_INTERVAL:
+                try:
+                    async with db_pool.acquire(timeout=5) as conn:
+                        await conn.fetchval("SELECT 1")
+                    last_db_probe = monotonic()
+                except:
+                    health_status['database'] = 'UNHEALTHY'
         
+        # Ping Redis and publish component health in one pipelined round-trip
         if redis_client:
             try:
-                await redis_client.ping()
-                health_status['redis'] = 'HEALTHY'
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    pipe.ping()
+                    pipe.hset('health', mapping=health_status)
+                    pipe.expire('health', 120)
+                    results = await pipe.execute()
+                health_status['redis'] = 'HEALTHY' if results[0] else 'UNHEALTHY'
             except:
                 health_status['redis'] = 'UNHEALTHY'
         
@@ -482,77 +677,108 @@ async def system_health_check():
         else:
             system_state['system_health'] = 'HEALTHY'
         
-        # Store health metrics in database
-        if db_pool:
-            async with db_pool.acquire() as conn:
-                for component, status in health_status.items():
-                    await conn.execute("""
-                        INSERT INTO system_metrics (metric_name, metric_value)
-                        VALUES ($1, $2)
-                    """, f"health_{component}", 1.0 if status == 'HEALTHY' else 0.0)
+        # Store health metrics
+        await pipeline_metrics({
+            f"health_{component}": 1.0 if status == 'HEALTHY' else 0.0
+            for component, status in health_status.items()
+        })
         
     except Exception as e:
         logger.error(f"Error in health check: {e}")
         system_state['system_health'] = 'ERROR'
 
+async def pipeline_metrics(metrics: Dict[str, float]):
+    """Write a batch of metrics to Redis in one round-trip and buffer them for system_metrics"""
+    if not metrics:
+        return
+    
+    if redis_client:
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.hset('system_metrics', mapping={
+                    name: msgpack.packb(value) for name, value in metrics.items()
+                })
+                pipe.expire('system_metrics', 120)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Error caching metrics in Redis: {e}")
+    
+    for name, value in metrics.items():
+        log_metric(name, value)
+
+# Symbols and mock series length used by the strategy loop
+STRATEGY_SYMBOLS = ("NIFTY", "BANKNIFTY", "FINNIFTY")
+MOCK_SERIES_LENGTH = 100
+
 async def execute_strategy_loop():
     """Execute all active trading strategies"""
-    if not system_state['trading_active'] or not CORE_COMPONENTS_AVAILABLE:
+    # Bail out before any async work outside market hours
+    if not system_state['trading_active'] or not CORE_COMPONENTS_AVAILABLE or not is_market_open():
         return
         
     try:
-        # Check if market is open
-        if not is_market_open():
-            return
+        # One timestamp for the whole tick
+        now = datetime.utcnow()
+        
+        pairs = [
+            (symbol, strategy_name, strategy_instance)
+            for symbol in STRATEGY_SYMBOLS
+            for strategy_name, strategy_instance in strategy_instances.items()
+            if hasattr(strategy_instance, 'analyze')
+        ]
+        count = len(pairs)
+        
+        # Mock price/volume series for every pair in one block; each row is a view
+        ltps = 19000 + RNG.random(count) * 1000
+        volumes = RNG.integers(10000, 100000, count)
+        price_block = RNG.random((count, MOCK_SERIES_LENGTH))
+        price_block *= 100
+        price_block += ltps[:, None]
+        volume_block = RNG.integers(-1000, 1000, (count, MOCK_SERIES_LENGTH))
+        volume_block += volumes[:, None]
+        
+        # Build every (strategy, symbol) analysis so they can run concurrently
+        jobs = [
+            (strategy_name, symbol, float(price_block[i, -1]))
+            for i, (symbol, strategy_name, _) in enumerate(pairs)
+        ]
+        coros = [
+            strategy_instance.analyze(symbol, price_block[i], volume_block[i], now)
+            for i, (symbol, _, strategy_instance) in enumerate(pairs)
+        ]
+        
+        signals = await asyncio.gather(*coros, return_exceptions=True)
+        
+        signal_rows = []
+        for (strategy_name, symbol, last_price), signal in zip(jobs, signals):
+            if isinstance(signal, Exception):
+                logger.error(f"Error executing strategy {strategy_name}: {signal}")
+                continue
             
-        # Execute each strategy
-        for strategy_name, strategy_instance in strategy_instances.items():
-            try:
-                # Get market data for strategy symbols
-                symbols = ["NIFTY", "BANKNIFTY", "FINNIFTY"]
+            if signal:
+                logger.info(f"Signal generated by {strategy_name}: {signal}")
                 
-                for symbol in symbols:
-                    # Generate mock market data
-                    market_data = {
-                        'symbol': symbol,
-                        'ltp': 19000 + np.random.random() * 1000,
-                        'volume': np.random.randint(10000, 100000),
-                        'timestamp': datetime.utcnow()
-                    }
-                    
-                    # Generate signals
-                    if hasattr(strategy_instance, 'analyze'):
-                        # Get price and volume data
-                        price_data = [market_data['ltp'] + np.random.random() * 100 for _ in range(100)]
-                        volume_data = [market_data['volume'] + np.random.randint(-1000, 1000) for _ in range(100)]
-                        
-                        signal = await strategy_instance.analyze(
-                            symbol, price_data, volume_data, datetime.utcnow()
-                        )
-                        
-                        if signal:
-                            logger.info(f"Signal generated by {strategy_name}: {signal}")
-                            
-                            # Store signal in database
-                            if db_pool:
-                                async with db_pool.acquire() as conn:
-                                    await conn.execute("""
-                                        INSERT INTO strategy_performance (
-                                            id, strategy_name, symbol, action, entry_price
-                                        ) VALUES ($1, $2, $3, $4, $5)
-                                    """, str(uuid.uuid4()), strategy_name, symbol,
-                                    signal['signal'], price_data[-1])
-                            
-            except Exception as e:
-                logger.error(f"Error executing strategy {strategy_name}: {e}")
+                signal_rows.append((
+                    str(uuid.uuid4()), strategy_name, symbol,
+                    signal['signal'], last_price
+                ))
+        
+        # Store all signals from this tick in one batch
+        await batch_insert(INSERT_STRATEGY_SIGNAL_SQL, signal_rows)
+        
+        await pipeline_metrics({'strategy_signals': float(len(signal_rows))})
         
     except Exception as e:
         logger.error(f"Error in strategy execution loop: {e}")
 
+# Market hours as minute-of-day, 09:15 to 15:30
+MARKET_OPEN_MINUTE = 9 * 60 + 15
+MARKET_CLOSE_MINUTE = 15 * 60 + 30
+
 def is_market_open() -> bool:
     """Check if market is currently open"""
-    current_time = datetime.now().time()
-    return time(9, 15) <= current_time <= time(15, 30)
+    now = datetime.now()
+    return MARKET_OPEN_MINUTE <= now.hour * 60 + now.minute <= MARKET_CLOSE_MINUTE
 
 async def broadcast_elite_recommendations(recommendations):
     """Broadcast elite recommendations to websocket clients"""
@@ -570,16 +796,98 @@ async def broadcast_elite_recommendations(recommendations):
 
 async def broadcast_websocket_message(message: Dict):
     """Broadcast message to all connected WebSocket clients"""
-    if websocket_connections:
-        disconnected = set()
-        for websocket in websocket_connections:
-            try:
-                await websocket.send_text(json.dumps(message))
-            except:
-                disconnected.add(websocket)
-        
-        # Remove disconnected clients
-        websocket_connections -= disconnected
+    if not websocket_connections:
+        return
+    
+    # Encode once; the dashboard JSON.parses text frames, so send as text
+    await broadcast_websocket_payload(orjson.dumps(message, option=ORJSON_OPTIONS).decode())
+
+async def broadcast_websocket_payload(payload: str):
+    """Fan out an already-encoded frame to all connected WebSocket clients"""
+    # Each client's writer task does the actual send, so a slow client
+    # only ever delays itself; large fan-outs yield to the loop between batches
+    clients = list(websocket_connections.values())
+    for i in range(0, len(clients), WS_BROADCAST_BATCH):
+        if i:
+            await asyncio.sleep(0)
+        for client in clients[i:i + WS_BROADCAST_BATCH]:
+            client.send(payload)
+
+@lru_cache(maxsize=4)
+def build_mock_analysis_frame(minute_bucket: int) -> pd.DataFrame:
+    """Mock OHLCV frame for market analysis; cached per minute bucket"""
+    periods = 100
+    dates = pd.date_range(start='2023-01-01', periods=periods, freq='1min')
+    return pd.DataFrame({
+        'open': RNG.random(periods) * 100 + 19000,
+        'high': RNG.random(periods) * 100 + 19100,
+        'low': RNG.random(periods) * 100 + 18900,
+        'close': RNG.random(periods) * 100 + 19000,
+        'volume': RNG.integers(1000, 10000, periods)
+    }, index=dates)
+
+# Static mock inputs for market analysis
+MOCK_MICROSTRUCTURE = {
+    'order_book': {'bids': [], 'asks': []},
+    'recent_trades': []
+}
+
+MOCK_OPTIONS_DATA = pd.DataFrame()
+
+MOCK_MARKET_INTERNALS = {
+    'breadth': {'advance_decline_ratio': 1.2, 'new_highs': 150, 'new_lows': 50},
+    'vix': {'current': 18, 'ma_20': 16}
+}
+
+# In-flight or finished market analysis, keyed by minute bucket
+market_analysis_tasks: Dict[int, asyncio.Task] = {}
+
+async def run_market_analysis(minute_bucket: int) -> Dict:
+    """Run all analyzers over the mock data for one minute bucket"""
+    # Mock data for analysis
+    mock_data = build_mock_analysis_frame(minute_bucket)
+    
+    # Mock timeframes data
+    all_timeframes = {
+        '15min': mock_data,
+        '1hour': mock_data,
+        '4hour': mock_data,
+        'daily': mock_data
+    }
+    
+    # Run all analyzers concurrently
+    analyzer_calls = {
+        'technical': analyzers['technical'].analyze(mock_data, all_timeframes),
+        'volume': analyzers['volume'].analyze(mock_data, MOCK_MICROSTRUCTURE),
+        'pattern': analyzers['pattern'].analyze(mock_data, all_timeframes),
+        'regime': analyzers['regime'].analyze(MOCK_MARKET_INTERNALS, mock_data),
+        'momentum': analyzers['momentum'].analyze(all_timeframes),
+        'smart_money': analyzers['smart_money'].analyze(MOCK_OPTIONS_DATA, MOCK_MICROSTRUCTURE)
+    }
+    results = await asyncio.gather(*analyzer_calls.values(), return_exceptions=True)
+    
+    analysis_results = {}
+    for name, result in zip(analyzer_calls, results):
+        if isinstance(result, Exception):
+            logger.error(f"{name} analysis error: {result}")
+            analysis_results[name] = {'score': 0, 'error': str(result)}
+        else:
+            analysis_results[name] = result
+    
+    # Calculate overall market score
+    overall_score = float(np.fromiter(
+        (result.get('score', 0.0) for result in analysis_results.values()),
+        dtype=np.float64,
+        count=len(analysis_results)
+    ).mean()) if analysis_results else 0.0
+    
+    return {
+        "status": "success",
+        "overall_score": round(overall_score, 2),
+        "analysis_timestamp": datetime.utcnow().isoformat(),
+        "market_condition": "EXCELLENT" if overall_score >= 9 else "GOOD" if overall_score >= 7 else "FAIR" if overall_score >= 5 else "POOR",
+        "detailed_analysis": analysis_results
+    }
 
 # API Routes
 @api_router.get("/")
@@ -613,7 +921,7 @@ async def get_system_status():
             active_positions=len(system_state['active_positions']),
             market_data_symbols=len(system_state['market_data']),
             components_health=components_health,
-            uptime=str(datetime.utcnow() - system_state['start_time'])
+            uptime=str(timedelta(seconds=monotonic() - start_monotonic))
         )
         
     except Exception as e:
@@ -672,100 +980,20 @@ async def get_market_analysis():
         if not analyzers:
             raise HTTPException(503, "Market analyzers not available")
         
-        # Mock data for analysis
-        periods = 100
-        dates = pd.date_range(start='2023-01-01', periods=periods, freq='1min')
-        mock_data = pd.DataFrame({
-            'open': np.random.random(periods) * 100 + 19000,
-            'high': np.random.random(periods) * 100 + 19100,
-            'low': np.random.random(periods) * 100 + 18900,
-            'close': np.random.random(periods) * 100 + 19000,
-            'volume': np.random.randint(1000, 10000, periods)
-        }, index=dates)
-        
-        # Mock timeframes data
-        all_timeframes = {
-            '15min': mock_data,
-            '1hour': mock_data,
-            '4hour': mock_data,
-            'daily': mock_data
-        }
-        
-        # Mock additional data
-        microstructure = {
-            'order_book': {'bids': [], 'asks': []},
-            'recent_trades': []
-        }
-        
-        options_data = pd.DataFrame()
-        
-        market_internals = {
-            'breadth': {'advance_decline_ratio': 1.2, 'new_highs': 150, 'new_lows': 50},
-            'vix': {'current': 18, 'ma_20': 16}
-        }
-        
-        # Run all analyzers
-        analysis_results = {}
+        # Every poll within the same minute shares one analysis run
+        minute_bucket = int(monotonic() // 60)
+        task = market_analysis_tasks.get(minute_bucket)
+        if task is None:
+            market_analysis_tasks.clear()
+            task = asyncio.create_task(run_market_analysis(minute_bucket))
+            market_analysis_tasks[minute_bucket] = task
         
         try:
-            # Technical Analysis
-            tech_result = await analyzers['technical'].analyze(mock_data, all_timeframes)
-            analysis_results['technical'] = tech_result
-        except Exception as e:
-            logger.error(f"Technical analysis error: {e}")
-            analysis_results['technical'] = {'score': 0, 'error': str(e)}
-        
-        try:
-            # Volume Analysis
-            volume_result = await analyzers['volume'].analyze(mock_data, microstructure)
-            analysis_results['volume'] = volume_result
-        except Exception as e:
-            logger.error(f"Volume analysis error: {e}")
-            analysis_results['volume'] = {'score': 0, 'error': str(e)}
-        
-        try:
-            # Pattern Analysis
-            pattern_result = await analyzers['pattern'].analyze(mock_data, all_timeframes)
-            analysis_results['pattern'] = pattern_result
-        except Exception as e:
-            logger.error(f"Pattern analysis error: {e}")
-            analysis_results['pattern'] = {'score': 0, 'error': str(e)}
-        
-        try:
-            # Regime Analysis
-            regime_result = await analyzers['regime'].analyze(market_internals, mock_data)
-            analysis_results['regime'] = regime_result
-        except Exception as e:
-            logger.error(f"Regime analysis error: {e}")
-            analysis_results['regime'] = {'score': 0, 'error': str(e)}
-        
-        try:
-            # Momentum Analysis
-            momentum_result = await analyzers['momentum'].analyze(all_timeframes)
-            analysis_results['momentum'] = momentum_result
-        except Exception as e:
-            logger.error(f"Momentum analysis error: {e}")
-            analysis_results['momentum'] = {'score': 0, 'error': str(e)}
-        
-        try:
-            # Smart Money Analysis
-            smart_money_result = await analyzers['smart_money'].analyze(options_data, microstructure)
-            analysis_results['smart_money'] = smart_money_result
-        except Exception as e:
-            logger.error(f"Smart money analysis error: {e}")
-            analysis_results['smart_money'] = {'score': 0, 'error': str(e)}
-        
-        # Calculate overall market score
-        scores = [result.get('score', 0) for result in analysis_results.values()]
-        overall_score = np.mean(scores) if scores else 0
-        
-        return {
-            "status": "success",
-            "overall_score": round(overall_score, 2),
-            "analysis_timestamp": datetime.utcnow().isoformat(),
-            "market_condition": "EXCELLENT" if overall_score >= 9 else "GOOD" if overall_score >= 7 else "FAIR" if overall_score >= 5 else "POOR",
-            "detailed_analysis": analysis_results
-        }
+            # Shield so a disconnecting client does not cancel the shared run
+            return await asyncio.shield(task)
+        except Exception:
+            market_analysis_tasks.pop(minute_bucket, None)
+            raise
         
     except Exception as e:
         logger.error(f"Error in market analysis: {e}")
@@ -780,7 +1008,7 @@ async def get_strategies():
         for name, strategy_instance in strategy_instances.items():
             strategy_data = {
                 'name': name,
-                'enabled': getattr(strategy_instance, 'is_enabled', True),
+                'enabled': strategy_instance.is_enabled,
                 'allocation': getattr(strategy_instance, 'allocation', 0.2),
                 'type': strategy_instance.__class__.__name__,
                 'health': 'healthy'
@@ -816,11 +1044,9 @@ async def toggle_strategy(strategy_name: str):
         strategy = strategy_instances[strategy_name]
         
         # Toggle enabled status
-        current_status = getattr(strategy, 'is_enabled', True)
-        new_status = not current_status
-        
-        if hasattr(strategy, 'is_enabled'):
-            strategy.is_enabled = new_status
+        new_status = not strategy.is_enabled
+        strategy.is_enabled = new_status
+        system_state['enabled_strategy_count'] += 1 if new_status else -1
         
         logger.info(f"Strategy {strategy_name} {'enabled' if new_status else 'disabled'}")
         
@@ -840,27 +1066,28 @@ async def emergency_stop():
     """Emergency stop all trading activities"""
     try:
         logger.critical("EMERGENCY STOP initiated via API")
+        ts = datetime.utcnow().isoformat()
         
         # Stop all trading
         system_state['trading_active'] = False
         system_state['emergency_mode'] = True
         
         # Disable all strategies
-        for strategy in strategy_instances.values():
-            if hasattr(strategy, 'is_enabled'):
-                strategy.is_enabled = False
+        for strategy in registered_strategies:
+            strategy.is_enabled = False
+        system_state['enabled_strategy_count'] = 0
         
         results = {
             'trading_stopped': True,
-            'strategies_disabled': len(strategy_instances),
-            'timestamp': datetime.utcnow().isoformat()
+            'strategies_disabled': len(registered_strategies),
+            'timestamp': ts
         }
         
         # Broadcast emergency stop to all clients
         await broadcast_websocket_message({
             "type": "emergency_stop",
             "message": "Emergency stop activated - All trading halted",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": ts
         })
         
         return {
@@ -878,29 +1105,29 @@ async def resume_trading():
     """Resume trading activities after emergency stop"""
     try:
         logger.info("Resuming trading activities")
+        ts = datetime.utcnow().isoformat()
         
         # Resume trading
         system_state['trading_active'] = True
         system_state['emergency_mode'] = False
         
         # Re-enable strategies
-        enabled_count = 0
-        for strategy in strategy_instances.values():
-            if hasattr(strategy, 'is_enabled'):
-                strategy.is_enabled = True
-                enabled_count += 1
+        for strategy in registered_strategies:
+            strategy.is_enabled = True
+        enabled_count = len(registered_strategies)
+        system_state['enabled_strategy_count'] = enabled_count
         
         results = {
             'trading_resumed': True,
             'strategies_enabled': enabled_count,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': ts
         }
         
         # Broadcast resume to all clients
         await broadcast_websocket_message({
             "type": "trading_resumed",
             "message": "Trading activities resumed",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": ts
         })
         
         return {
@@ -913,11 +1140,17 @@ async def resume_trading():
         logger.error(f"Error resuming trading: {e}")
         raise HTTPException(500, f"Error resuming trading: {str(e)}")
 
+async def drain_incoming(websocket: WebSocket):
+    """Read and discard client messages until the socket closes"""
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
 @api_router.websocket("/ws/trading-data")
 async def websocket_trading_data(websocket: WebSocket):
     """WebSocket endpoint for real-time trading data"""
     await websocket.accept()
-    websocket_connections.add(websocket)
+    client = WSClient(websocket)
+    websocket_connections[websocket] = client
     
     try:
         # Send initial data
@@ -926,34 +1159,73 @@ async def websocket_trading_data(websocket: WebSocket):
             "system_status": system_state,
             "market_open": is_market_open(),
             "strategies": len(strategy_instances),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.utcnow()
         }
         
-        await websocket.send_text(json.dumps(initial_data))
+        client.send(orjson.dumps(initial_data, option=ORJSON_OPTIONS).decode())
         
-        # Keep connection alive and send periodic updates
-        while True:
-            await asyncio.sleep(10)
-            
-            # Send system update
-            update = {
-                "type": "system_update",
-                "system_health": system_state['system_health'],
-                "trading_active": system_state['trading_active'],
-                "daily_pnl": system_state['daily_pnl'],
-                "active_strategies": len([s for s in strategy_instances.values() 
-                                        if getattr(s, 'is_enabled', True)]),
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-            await websocket.send_text(json.dumps(update))
+        # Periodic updates come from system_update_broadcaster. Read the
+        # socket so a close is seen immediately, not on the next failed send
+        receiver = asyncio.create_task(drain_incoming(websocket))
+        try:
+            await asyncio.wait({client.task, receiver}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # Stop whichever side is still running and collect both outcomes,
+            # so a disconnect raised in either task is never left unretrieved
+            receiver.cancel()
+            client.task.cancel()
+            await asyncio.gather(receiver, client.task, return_exceptions=True)
+        
+        logger.info("WebSocket client disconnected")
             
     except WebSocketDisconnect:
-        websocket_connections.discard(websocket)
         logger.info("WebSocket client disconnected")
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
-        websocket_connections.discard(websocket)
+    finally:
+        client.close()
+
+# Interval between system_update frames pushed to every WebSocket client
+SYSTEM_UPDATE_INTERVAL = 10
+system_update_task = None
+
+# Fixed system_update skeleton; only the broadcaster mutates it, and each
+# tick is encoded before the next one starts
+system_update_frame = {
+    "type": "system_update",
+    "system_health": None,
+    "trading_active": None,
+    "daily_pnl": None,
+    "active_strategies": 0,
+    "timestamp": None
+}
+
+async def system_update_broadcaster():
+    """Build one system_update frame per tick and fan it out to all clients"""
+    # Sleep to fixed deadlines so send time doesn't stretch the cadence;
+    # if a tick overruns, skip ahead rather than bursting to catch up
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+    while True:
+        next_tick += SYSTEM_UPDATE_INTERVAL
+        delay = next_tick - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        else:
+            next_tick = loop.time()
+        if not websocket_connections:
+            continue
+        try:
+            update = system_update_frame
+            update["system_health"] = system_state['system_health']
+            update["trading_active"] = system_state['trading_active']
+            update["daily_pnl"] = system_state['daily_pnl']
+            update["active_strategies"] = system_state['enabled_strategy_count']
+            update["timestamp"] = datetime.utcnow()
+            # Encode before any await so the shared dict can't change underneath
+            await broadcast_websocket_payload(orjson.dumps(update, option=ORJSON_OPTIONS).decode())
+        except Exception as e:
+            logger.error(f"Error broadcasting system update: {e}")
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -962,14 +1234,20 @@ app.include_router(api_router)
 @app.on_event("startup")
 async def startup_event():
     """Initialize everything on startup"""
+    global metrics_flush_task, system_update_task, start_monotonic
+    
     try:
         logger.info("Starting Elite Autonomous Algo Trading Platform...")
         
         system_state['start_time'] = datetime.utcnow()
+        start_monotonic = monotonic()
         
         # Initialize database
         await init_database()
         
+        # Start the system_metrics COPY flusher
+        metrics_flush_task = asyncio.create_task(metrics_flush_loop())
+        
         # Initialize elite trading system
         if CORE_COMPONENTS_AVAILABLE:
             await initialize_elite_trading_system()
@@ -978,6 +1256,9 @@ async def startup_event():
         # Setup scheduler
         setup_scheduler()
         
+        # One shared producer for the periodic WebSocket system updates
+        system_update_task = asyncio.create_task(system_update_broadcaster())
+        
         # Mark system as initialized
         system_state['initialized'] = True
         
@@ -994,19 +1275,36 @@ async def shutdown_event():
     try:
         logger.info("Shutting down Elite Trading Platform...")
         
-        # Stop scheduler
+        # Stop scheduler without blocking the loop on in-flight jobs
         if scheduler.running:
-            scheduler.shutdown()
+            scheduler.shutdown(wait=False)
+        
+        if system_update_task:
+            system_update_task.cancel()
         
         # Stop all trading activities
         system_state['trading_active'] = False
         
-        # Close database connections
+        # Write out any buffered metrics before the pool closes
+        if metrics_flush_task:
+            metrics_flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await metrics_flush_task
+        try:
+            await flush_metrics()
+        except Exception as e:
+            logger.error(f"Error flushing system metrics on shutdown: {e}")
+        
+        # Close database connections side by side; one failing close
+        # must not stop the other
+        closes = []
         if redis_client:
-            await redis_client.close()
-            
+            closes.append(close_redis())
         if db_pool:
-            await db_pool.close()
+            closes.append(db_pool.close())
+        for result in await asyncio.gather(*closes, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error closing connection: {result}")
         
         logger.info("Elite Trading Platform shutdown complete")
         
@@ -1015,4 +1313,18 @@ async def shutdown_event():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+
+    # uvloop and httptools ship with uvicorn[standard]; fall back to stdlib if absent
+    try:
+        import uvloop
+        uvloop.install()
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "h11"
+
+    uvicorn.run(app, host="0.0.0.0", port=8001, loop=loop_impl, http=http_impl, log_level="info")
@@ -11,27 +11,29 @@ Critical Issues Fixed:
 
 import os
 import sys
-import json
 import uuid
 import asyncio
 import logging
+import logging.handlers
+import queue
 import traceback
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Literal, Optional, Any
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
 
 # FastAPI and core dependencies
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 # Database and async
 import asyncpg
-import aioredis
+import redis.asyncio as redis
 import aiosqlite
 
 # Security
@@ -51,17 +53,45 @@ from typing import Union
 import psutil
 import time
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/var/log/algo-trading/app.log'),
-        logging.StreamHandler()
-    ]
-)
+# Message timestamps: one ISO string per second, shared by every frame in it
+from src.core.utils import utc_now_iso
+
+# Fast JSON encoding
+import orjson
+
+# Configure logging; plain console output until a serving process installs
+# the log queue at startup (the uvicorn supervisor never does)
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
+# In a serving process records are formatted on the calling side and written
+# by a listener thread so file I/O never blocks the event loop
+log_queue: queue.Queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.handlers.WatchedFileHandler('/var/log/algo-trading/app.log', delay=True),
+    logging.StreamHandler()
+)
+
+def set_root_handler(handler: logging.Handler):
+    """Make handler the root logger's only handler"""
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+
+def start_log_queue():
+    """Send this process's logging through log_queue and start its writer thread"""
+    set_root_handler(logging.handlers.QueueHandler(log_queue))
+    log_listener.start()
+
+def stop_log_queue():
+    """Flush and stop the writer thread, going back to direct console output"""
+    log_listener.stop()
+    set_root_handler(logging.StreamHandler())
+
 # Security Configuration
 security = HTTPBearer()
 SECRET_KEY = os.environ.get('SECRET_KEY', 'change-this-secret-key-in-production')
@@ -89,22 +119,59 @@ ZERODHA_API_KEY = os.environ.get('ZERODHA_API_KEY', '')
 ZERODHA_API_SECRET = os.environ.get('ZERODHA_API_SECRET', '')
 ZERODHA_CLIENT_ID = os.environ.get('ZERODHA_CLIENT_ID', '')
 
+# orjson writes naive datetimes as UTC ISO-8601; default=str covers anything else
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC
+
+def encode_message(message: Dict) -> str:
+    """Encode a WebSocket message as a JSON text frame"""
+    return orjson.dumps(message, default=str, option=ORJSON_OPTIONS).decode()
+
 # Global state
-system_state = {
-    'system_health': 'HEALTHY',
-    'trading_active': True,
-    'paper_trading': PAPER_TRADING,
-    'autonomous_trading': AUTONOMOUS_TRADING_ENABLED,
-    'market_open': False,
-    'daily_pnl': 0.0,
-    'strategies_active': 7,
-    'database_connected': False,
-    'redis_connected': False,
-    'truedata_connected': False,
-    'zerodha_connected': False,
-    'websocket_connections': 0,
-    'last_updated': datetime.utcnow().isoformat()
-}
+@dataclass(frozen=True, slots=True)
+class SystemState:
+    """Immutable snapshot of platform state; replaced wholesale on every change"""
+    system_health: str = 'HEALTHY'
+    trading_active: bool = True
+    paper_trading: bool = PAPER_TRADING
+    autonomous_trading: bool = AUTONOMOUS_TRADING_ENABLED
+    market_open: bool = False
+    daily_pnl: float = 0.0
+    strategies_active: int = 7
+    database_connected: bool = False
+    redis_connected: bool = False
+    truedata_connected: bool = False
+    zerodha_connected: bool = False
+    websocket_connections: int = 0
+    last_updated: str = field(default_factory=utc_now_iso)
+
+system_state = SystemState()
+
+# Fields carried by autonomous_update; a change to any of them pushes a fresh frame
+AUTONOMOUS_STATE_FIELDS = ('system_health', 'trading_active', 'market_open')
+autonomous_state_changed = asyncio.Event()
+
+# Bumped whenever system_state or market_data_cache changes, so periodic
+# senders can tell whether a client already has the latest snapshot
+state_revision = 0
+
+def update_state(**changes):
+    """Swap in a new SystemState with the given fields changed"""
+    global system_state, state_revision
+    previous, system_state = system_state, replace(system_state, **changes)
+    if system_state != previous:
+        state_revision += 1
+    if any(getattr(previous, name) != getattr(system_state, name)
+           for name in AUTONOMOUS_STATE_FIELDS if name in changes):
+        autonomous_state_changed.set()
+
+# Host metrics, sampled in the background so requests never read /proc
+BOOT_TIME = psutil.boot_time()
+performance_metrics = {'cpu_percent': 0.0, 'memory_percent': 0.0}
+
+def sample_system_metrics():
+    """Refresh CPU and memory utilisation since the previous sample"""
+    performance_metrics['cpu_percent'] = psutil.cpu_percent()
+    performance_metrics['memory_percent'] = psutil.virtual_memory().percent
 
 # Connection pools
 db_pool = None
@@ -115,6 +182,11 @@ strategy_instances = {}
 # TrueData connection
 truedata_connection = None
 market_data_cache = {}
+# Newest timestamp written into market_data_cache
+last_market_update: Optional[str] = None
+MARKET_SYMBOLS = ["NIFTY", "BANKNIFTY", "FINNIFTY"]
+# Seconds a fetched quote is shared between the 5s market and 30s strategy jobs
+MARKET_DATA_CACHE_TTL = 2
 
 # Security Middleware
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -137,29 +209,49 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     def __init__(self, app, requests_per_minute: int = 100):
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
-        self.clients = {}
+        # Fixed one-minute window: request counts per IP for the current window
+        self.window = 0
+        self.clients: Dict[str, int] = {}
+        self.redis_failing = False
+    
+    async def count_request(self, client_ip: str, window: int) -> int:
+        """Count a request against the IP's current window and return the new total"""
+        # Shared across workers via Redis when available
+        if redis_pool and system_state.redis_connected:
+            try:
+                key = f"ratelimit:{client_ip}:{window}"
+                pipe = redis_pool.pipeline(transaction=False)
+                pipe.incr(key)
+                pipe.expire(key, 120)
+                count, _ = await pipe.execute()
+                self.redis_failing = False
+                return count
+            except Exception as e:
+                # Warn once per outage, not on every request
+                if not self.redis_failing:
+                    logger.warning(f"Redis rate limit unavailable, using local counter: {e}")
+                    self.redis_failing = True
+        
+        # A new window starts every IP from zero
+        if window != self.window:
+            self.window = window
+            self.clients = {}
+        
+        count = self.clients.get(client_ip, 0) + 1
+        self.clients[client_ip] = count
+        return count
     
     async def dispatch(self, request: Request, call_next):
         client_ip = request.client.host
         current_time = time.time()
         
-        # Clean old entries
-        cutoff_time = current_time - 60
-        self.clients = {ip: times for ip, times in self.clients.items() 
-                       if times and max(times) > cutoff_time}
-        
         # Check rate limit
-        if client_ip in self.clients:
-            self.clients[client_ip] = [t for t in self.clients[client_ip] if t > cutoff_time]
-            if len(self.clients[client_ip]) >= self.requests_per_minute:
-                return JSONResponse(
-                    status_code=429,
-                    content={"error": "Rate limit exceeded", "retry_after": 60}
-                )
-        else:
-            self.clients[client_ip] = []
-        
-        self.clients[client_ip].append(current_time)
+        count = await self.count_request(client_ip, int(current_time // 60))
+        if count > self.requests_per_minute:
+            return JSONResponse(
+                status_code=429,
+                content={"error": "Rate limit exceeded", "retry_after": 60 - int(current_time % 60)}
+            )
         
         response = await call_next(request)
         return response
@@ -177,7 +269,8 @@ app = FastAPI(
     title="ALGO-FRONTEND Elite Autonomous Trading Platform",
     description="Production-Ready Autonomous Algorithmic Trading System",
     version="3.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add middleware (order matters!)
@@ -201,7 +294,7 @@ class TradingSignal(BaseModel):
     signal_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     strategy_name: str
     symbol: str
-    action: str = Field(..., regex='^(BUY|SELL)$')
+    action: Literal["BUY", "SELL"]
     quality_score: float = Field(..., ge=0, le=10)
     confidence_level: float = Field(..., ge=0, le=1)
     quantity: int = Field(..., gt=0)
@@ -250,7 +343,7 @@ class TrueDataManager:
             
             self.connected = True
             self.reconnect_attempts = 0
-            system_state['truedata_connected'] = True
+            update_state(truedata_connected=True)
             
             logger.info("✅ TrueData connected successfully")
             return True
@@ -258,7 +351,7 @@ class TrueDataManager:
         except Exception as e:
             logger.error(f"TrueData connection failed: {e}")
             self.connected = False
-            system_state['truedata_connected'] = False
+            update_state(truedata_connected=False)
             return False
     
     async def disconnect(self):
@@ -268,16 +361,39 @@ class TrueDataManager:
                 # Close connection properly
                 pass
             self.connected = False
-            system_state['truedata_connected'] = False
+            update_state(truedata_connected=False)
+            # Drop cached quotes so nothing stale outlives the connection
+            if redis_pool is not None and system_state.redis_connected:
+                await redis_pool.delete(*(f"md:{symbol}" for symbol in MARKET_SYMBOLS))
             logger.info("TrueData disconnected")
         except Exception as e:
             logger.error(f"Error disconnecting TrueData: {e}")
     
     async def get_live_data(self, symbol: str) -> Optional[Dict]:
-        """Get live market data for symbol"""
+        """Get live market data for symbol, shared through a short Redis cache"""
         if not self.connected:
             return None
-            
+        
+        use_cache = redis_pool is not None and system_state.redis_connected
+        key = f"md:{symbol}"
+        if use_cache:
+            try:
+                cached = await redis_pool.get(key)
+                if cached:
+                    return orjson.loads(cached)
+            except Exception as e:
+                logger.warning(f"Market data cache read failed for {symbol}: {e}")
+        
+        data = await self.fetch_live_data(symbol)
+        if data and use_cache:
+            try:
+                await redis_pool.set(key, orjson.dumps(data), ex=MARKET_DATA_CACHE_TTL)
+            except Exception as e:
+                logger.warning(f"Market data cache write failed for {symbol}: {e}")
+        return data
+    
+    async def fetch_live_data(self, symbol: str) -> Optional[Dict]:
+        """Fetch live market data for symbol from TrueData"""
         try:
             # Implement actual TrueData API call here
             # This is a placeholder
@@ -287,7 +403,7 @@ class TrueDataManager:
                 "change": 0.5,
                 "change_percent": 0.025,
                 "volume": 1000000,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             }
         except Exception as e:
             logger.error(f"Error getting live data for {symbol}: {e}")
@@ -305,30 +421,62 @@ class TrueDataManager:
 # Global TrueData manager
 truedata_manager = TrueDataManager()
 
+# Broadcast channels a client can opt into with ?channels=market,health;
+# clients that don't ask get all of them
+BROADCAST_CHANNELS = ("market", "health")
+# Redis pub/sub channel carrying API-triggered broadcasts to every process serving
+# WebSocket clients; the server runs one worker for now (see __main__)
+BROADCAST_RELAY_CHANNEL = "ws:broadcast"
+
+# Endpoint types with their own streams (client_info["type"] passed to connect)
+WS_STREAMS = ("trading_data", "autonomous_data")
+
+# Broadcast fan-out limits: concurrent sends, and seconds before a send counts as failed
+WS_MAX_CONCURRENT_SENDS = 100
+WS_SEND_TIMEOUT = 5
+
+# Ping frame skeleton; only the timestamp and health status vary
+PING_TEMPLATE = '{"type":"ping","timestamp":"%s","system_status":%s}'
+
 # Enhanced WebSocket Manager
 class WebSocketManager:
     def __init__(self):
         self.connections: set = set()
         self.connection_info: Dict[WebSocket, Dict] = {}
+        self.channels: Dict[str, set] = {name: set() for name in BROADCAST_CHANNELS}
+        # Clients per endpoint type (client_info["type"]), for endpoint-specific streams
+        self.streams: Dict[str, set] = {name: set() for name in WS_STREAMS}
+        # Caps in-flight sends per broadcast so a large fan-out can't flood the loop
+        self.send_limit = asyncio.Semaphore(WS_MAX_CONCURRENT_SENDS)
+        # Latest not-yet-sent scheduler message (and its channel) per type
+        self.pending: Dict[str, tuple] = {}
+        self.pending_event = asyncio.Event()
+        self.broadcaster_task = None
+        self.relay_task = None
     
     async def connect(self, websocket: WebSocket, client_info: Dict = None):
         """Connect a WebSocket with proper error handling"""
         try:
             await websocket.accept()
             self.connections.add(websocket)
+            requested = websocket.query_params.get("channels")
+            for name in requested.split(",") if requested else BROADCAST_CHANNELS:
+                if name in self.channels:
+                    self.channels[name].add(websocket)
+            self.streams.setdefault((client_info or {}).get("type"), set()).add(websocket)
             self.connection_info[websocket] = {
                 "connected_at": datetime.utcnow(),
                 "client_info": client_info or {},
                 "last_ping": datetime.utcnow()
             }
-            system_state['websocket_connections'] = len(self.connections)
+            update_state(websocket_connections=len(self.connections))
             logger.info(f"WebSocket connected. Total connections: {len(self.connections)}")
             
             # Send initial connection success message
             await self.send_to_client(websocket, {
                 "type": "connection_established",
                 "status": "connected",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             })
             
         except Exception as e:
@@ -339,46 +487,147 @@ class WebSocketManager:
         """Safely disconnect a WebSocket"""
         self.connections.discard(websocket)
         self.connection_info.pop(websocket, None)
-        system_state['websocket_connections'] = len(self.connections)
+        for members in self.channels.values():
+            members.discard(websocket)
+        for members in self.streams.values():
+            members.discard(websocket)
+        update_state(websocket_connections=len(self.connections))
         logger.info(f"WebSocket disconnected. Total connections: {len(self.connections)}")
     
-    async def send_to_client(self, websocket: WebSocket, message: Dict):
-        """Send message to specific WebSocket client"""
+    async def send_to_client(self, websocket: WebSocket, message: Union[Dict, str]):
+        """Send a message, or an already-encoded payload, to specific WebSocket client"""
         try:
-            await websocket.send_text(json.dumps(message, default=str))
+            if not isinstance(message, str):
+                message = encode_message(message)
+            await websocket.send_text(message)
         except Exception as e:
             logger.error(f"Error sending WebSocket message: {e}")
             self.disconnect(websocket)
     
-    async def broadcast(self, message: Dict):
-        """Broadcast message to all connected clients"""
-        if not self.connections:
+    async def broadcast(self, message: Dict, channel: Optional[str] = None, text: Optional[str] = None,
+                        targets: Optional[set] = None):
+        """Broadcast message to all connected clients, only a channel's subscribers, or the
+        given targets; text, if given, is the message already encoded as JSON"""
+        if targets is None:
+            targets = self.connections if channel is None else self.channels[channel]
+        if not targets:
             return
-            
-        disconnected = set()
-        for websocket in self.connections:
-            try:
-                await websocket.send_text(json.dumps(message, default=str))
-            except Exception as e:
-                logger.error(f"Error broadcasting to WebSocket: {e}")
-                disconnected.add(websocket)
+        
+        # Encode once and send the same payload to every client
+        await self.broadcast_payload(text or encode_message(message), targets)
+    
+    async def broadcast_payload(self, payload: str, targets: Optional[set] = None):
+        """Send an already-encoded payload to the given (default: all) clients concurrently"""
+        connections = list(self.connections if targets is None else targets)
+        results = await asyncio.gather(
+            *(self.limited_send(websocket.send_text(payload)) for websocket in connections),
+            return_exceptions=True
+        )
         
         # Remove disconnected clients
-        for websocket in disconnected:
-            self.disconnect(websocket)
+        for websocket, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error broadcasting to WebSocket: {result}")
+                self.disconnect(websocket)
+    
+    async def limited_send(self, send):
+        """Run one send under the concurrency cap, giving up on clients that stall"""
+        async with self.send_limit:
+            await asyncio.wait_for(send, WS_SEND_TIMEOUT)
+    
+    async def publish(self, message: Dict, channel: Optional[str] = None):
+        """Broadcast to clients on every worker, relaying through Redis when available"""
+        if self.relay_task and not self.relay_task.done():
+            try:
+                envelope = orjson.dumps({"channel": channel, "message": message},
+                                        default=str, option=ORJSON_OPTIONS)
+                await redis_pool.publish(BROADCAST_RELAY_CHANNEL, envelope)
+                return
+            except Exception as e:
+                logger.warning(f"Broadcast relay unavailable, sending locally: {e}")
+        await self.broadcast(message, channel)
+    
+    async def run_relay(self):
+        """Fan out messages published by any worker to this worker's clients"""
+        pubsub = redis_pool.pubsub()
+        await pubsub.subscribe(BROADCAST_RELAY_CHANNEL)
+        try:
+            async for item in pubsub.listen():
+                if item["type"] != "message":
+                    continue
+                try:
+                    envelope = orjson.loads(item["data"])
+                    await self.broadcast(envelope["message"], envelope["channel"])
+                except Exception as e:
+                    logger.error(f"Error relaying broadcast: {e}")
+        finally:
+            await pubsub.reset()
+    
+    def enqueue(self, message: Dict, channel: Optional[str] = None):
+        """Queue message for broadcast; a newer message of the same type replaces it"""
+        self.pending[message["type"]] = (channel, message)
+        self.pending_event.set()
+    
+    async def run_broadcaster(self):
+        """Broadcast queued messages, sending only the latest of each type"""
+        while True:
+            await self.pending_event.wait()
+            self.pending_event.clear()
+            pending, self.pending = self.pending, {}
+            for channel, message in pending.values():
+                try:
+                    await self.broadcast(message, channel)
+                except Exception as e:
+                    logger.error(f"Error broadcasting {message['type']}: {e}")
     
     async def ping_clients(self):
         """Send ping to all clients to keep connections alive"""
+        timestamp = utc_now_iso()
+        health = system_state.system_health
         ping_message = {
             "type": "ping",
-            "timestamp": datetime.utcnow().isoformat(),
-            "system_status": system_state['system_health']
+            "timestamp": timestamp,
+            "system_status": health
         }
-        await self.broadcast(ping_message)
+        # JSON clients get the fixed template filled in; no full encode
+        text = PING_TEMPLATE % (timestamp, orjson.dumps(health).decode())
+        await self.broadcast(ping_message, text=text)
 
 # Global WebSocket manager
 ws_manager = WebSocketManager()
 
+# SQLite connection pool
+class SQLitePool:
+    """Long-lived aiosqlite connections behind asyncpg's acquire()/close() interface"""
+    def __init__(self, path: str, size: int = 5):
+        self.path = path
+        self.size = size
+        self.connections: List[aiosqlite.Connection] = []
+        self.idle: asyncio.Queue = asyncio.Queue()
+    
+    async def open(self):
+        """Open every connection up front so their page caches stay warm"""
+        for _ in range(self.size):
+            conn = await aiosqlite.connect(self.path)
+            self.connections.append(conn)
+            self.idle.put_nowait(conn)
+        return self
+    
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow a connection, returning it to the pool afterwards"""
+        conn = await self.idle.get()
+        try:
+            yield conn
+        finally:
+            self.idle.put_nowait(conn)
+    
+    async def close(self):
+        """Close all pooled connections"""
+        for conn in self.connections:
+            await conn.close()
+        self.connections.clear()
+
 # Database operations with better error handling
 async def init_database():
     """Initialize database connection with retry logic"""
@@ -389,11 +638,20 @@ async def init_database():
     for attempt in range(max_retries):
         try:
             if DATABASE_URL.startswith('postgresql'):
+                # Sized to the host; the scheduler's repeated queries stay
+                # prepared in each connection's statement cache
+                cpus = os.cpu_count() or 4
                 db_pool = await asyncpg.create_pool(
                     DATABASE_URL,
-                    min_size=5,
-                    max_size=20,
-                    command_timeout=30
+                    min_size=cpus,
+                    max_size=cpus * 4,
+                    command_timeout=30,
+                    max_inactive_connection_lifetime=300,
+                    statement_cache_size=1024,
+                    server_settings={
+                        'jit': 'off',
+                        'application_name': 'algo-frontend'
+                    }
                 )
                 # Test connection
                 async with db_pool.acquire() as conn:
@@ -401,9 +659,9 @@ async def init_database():
                     
             else:
                 # SQLite fallback
-                db_pool = await aiosqlite.connect('trading_system.db')
+                db_pool = await SQLitePool('trading_system.db').open()
                 
-            system_state['database_connected'] = True
+            update_state(database_connected=True)
             logger.info("✅ Database connected successfully")
             return True
             
@@ -412,27 +670,30 @@ async def init_database():
             if attempt < max_retries - 1:
                 await asyncio.sleep(retry_delay)
             else:
-                system_state['database_connected'] = False
+                update_state(database_connected=False)
                 return False
 
 async def init_redis():
     """Initialize Redis connection"""
     global redis_pool
     try:
-        redis_pool = await aioredis.from_url(REDIS_URL, decode_responses=True)
+        # Replies are parsed by hiredis when it is installed
+        redis_pool = redis.from_url(REDIS_URL, decode_responses=True, health_check_interval=30)
         await redis_pool.ping()
-        system_state['redis_connected'] = True
+        update_state(redis_connected=True)
         logger.info("✅ Redis connected successfully")
         return True
     except Exception as e:
         logger.error(f"Redis connection failed: {e}")
-        system_state['redis_connected'] = False
+        update_state(redis_connected=False)
         return False
 
 # Strategy execution with proper error handling
 async def execute_strategy_loop():
     """Execute trading strategies with enhanced error handling"""
-    if not system_state['trading_active'] or not system_state['database_connected']:
+    global last_market_update, state_revision
+    
+    if not system_state.trading_active or not system_state.database_connected:
         return
         
     try:
@@ -440,26 +701,34 @@ async def execute_strategy_loop():
         if not is_market_open():
             return
             
-        symbols = ["NIFTY", "BANKNIFTY", "FINNIFTY"]
+        # Get real market data for all symbols concurrently
+        results = await asyncio.gather(
+            *(truedata_manager.get_live_data(symbol) for symbol in MARKET_SYMBOLS),
+            return_exceptions=True
+        )
         
-        for symbol in symbols:
-            try:
-                # Get real market data
-                market_data = await truedata_manager.get_live_data(symbol)
-                
-                if not market_data:
-                    logger.warning(f"No market data available for {symbol}")
-                    continue
-                
+        ready = []
+        for symbol, market_data in zip(MARKET_SYMBOLS, results):
+            if isinstance(market_data, Exception):
+                logger.error(f"Error processing symbol {symbol}: {market_data}")
+            elif not market_data:
+                logger.warning(f"No market data available for {symbol}")
+            else:
                 # Cache market data
                 market_data_cache[symbol] = market_data
-                
-                # Execute strategies (implement actual strategy logic here)
-                # This is a placeholder for real strategy execution
-                await process_symbol_strategies(symbol, market_data)
-                
-            except Exception as e:
-                logger.error(f"Error processing symbol {symbol}: {e}")
+                state_revision += 1
+                last_market_update = max(last_market_update or '', market_data.get('timestamp', ''))
+                ready.append((symbol, market_data))
+        
+        # Execute strategies (implement actual strategy logic here)
+        # This is a placeholder for real strategy execution
+        results = await asyncio.gather(
+            *(process_symbol_strategies(symbol, market_data) for symbol, market_data in ready),
+            return_exceptions=True
+        )
+        for (symbol, _), result in zip(ready, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing symbol {symbol}: {result}")
                 
     except Exception as e:
         logger.error(f"Error in strategy execution loop: {e}")
@@ -470,24 +739,102 @@ async def process_symbol_strategies(symbol: str, market_data: Dict):
     # This is a placeholder that demonstrates the structure
     pass
 
+# Today's session boundaries, plus the last answer reused within the same second
+market_hours_cache = {'date': None, 'open': None, 'close': None, 'checked_at': float('-inf')}
+
 def is_market_open() -> bool:
     """Check if market is currently open"""
+    checked_at = time.monotonic()
+    if checked_at - market_hours_cache['checked_at'] < 1:
+        return system_state.market_open
+    
     now = datetime.now()
+    today = now.date()
     # Simple market hours check (9:15 AM to 3:30 PM IST on weekdays)
-    if now.weekday() >= 5:  # Weekend
-        return False
-    
-    market_start = now.replace(hour=9, minute=15, second=0, microsecond=0)
-    market_end = now.replace(hour=15, minute=30, second=0, microsecond=0)
+    if market_hours_cache['date'] != today:
+        market_hours_cache.update(
+            date=today,
+            open=now.replace(hour=9, minute=15, second=0, microsecond=0),
+            close=now.replace(hour=15, minute=30, second=0, microsecond=0)
+        )
     
-    system_state['market_open'] = market_start <= now <= market_end
-    return system_state['market_open']
+    market_hours_cache['checked_at'] = checked_at
+    update_state(market_open=(
+        now.weekday() < 5 and market_hours_cache['open'] <= now <= market_hours_cache['close']
+    ))
+    return system_state.market_open
 
-# Scheduler setup
-scheduler = AsyncIOScheduler()
+# Periodic WebSocket frames, built and encoded once per tick for every client
+PERIODIC_UPDATE_INTERVAL = 10
+periodic_frames: Dict[str, Any] = {'trading': None, 'autonomous': None, 'heartbeat': None, 'revision': 0}
+periodic_frames_task = None
+
+def shared_frame(message: Dict) -> Dict:
+    """Wrap a message with its JSON encoding"""
+    return {'message': message, 'text': encode_message(message)}
+
+def build_periodic_frames():
+    """Build this tick's periodic_update, autonomous_update and heartbeat frames"""
+    timestamp = utc_now_iso()
+    periodic_frames['revision'] = state_revision
+    periodic_frames['trading'] = shared_frame({
+        "type": "periodic_update",
+        "system_status": system_state,
+        "market_data": market_data_cache,
+        "timestamp": timestamp
+    })
+    periodic_frames['autonomous'] = shared_frame({
+        "type": "autonomous_update",
+        "system_health": system_state.system_health,
+        "trading_active": system_state.trading_active,
+        "strategies_status": {name: {"enabled": data.get("enabled", True)} 
+                           for name, data in strategy_instances.items()},
+        "market_status": "OPEN" if system_state.market_open else "CLOSED",
+        "timestamp": timestamp
+    })
+    # Sent instead of periodic_update to clients that already have this revision
+    periodic_frames['heartbeat'] = shared_frame({
+        "type": "heartbeat",
+        "revision": state_revision,
+        "timestamp": timestamp
+    })
+
+def next_periodic_frame(sent_revision: int) -> tuple:
+    """periodic_update if it is newer than the revision a client has, else the heartbeat;
+    returns the frame and the client's revision after sending it"""
+    if periodic_frames['revision'] > sent_revision:
+        return periodic_frames['trading'], periodic_frames['revision']
+    return periodic_frames['heartbeat'], sent_revision
+
+async def periodic_frames_loop():
+    """Rebuild the periodic frames and push autonomous_update to its clients as soon as
+    the state behind it changes, or every interval otherwise"""
+    while True:
+        try:
+            await asyncio.wait_for(autonomous_state_changed.wait(), PERIODIC_UPDATE_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        autonomous_state_changed.clear()
+        try:
+            build_periodic_frames()
+            frame = periodic_frames['autonomous']
+            await ws_manager.broadcast(frame['message'], text=frame['text'],
+                                       targets=ws_manager.streams["autonomous_data"])
+        except Exception as e:
+            logger.error(f"Error broadcasting periodic frames: {e}")
+
+# Scheduler setup; an overrunning job collapses its missed runs into one
+# instead of stacking concurrent copies
+scheduler = AsyncIOScheduler(job_defaults={
+    'coalesce': True,
+    'max_instances': 1,
+    'misfire_grace_time': 10
+})
 
 async def startup_event():
     """Enhanced startup with proper initialization"""
+    global periodic_frames_task
+    start_log_queue()
     logger.info("🚀 Starting ALGO-FRONTEND Elite Trading Platform...")
     
     # Initialize database
@@ -502,6 +849,17 @@ async def startup_event():
     # Initialize strategies
     await initialize_strategies()
     
+    # Single sender for scheduler broadcasts
+    ws_manager.broadcaster_task = asyncio.create_task(ws_manager.run_broadcaster())
+    
+    # Cross-worker relay for API-triggered broadcasts
+    if system_state.redis_connected:
+        ws_manager.relay_task = asyncio.create_task(ws_manager.run_relay())
+    
+    # Shared periodic WebSocket frames
+    build_periodic_frames()
+    periodic_frames_task = asyncio.create_task(periodic_frames_loop())
+    
     # Start scheduler
     try:
         # Strategy execution every 30 seconds during market hours
@@ -528,6 +886,14 @@ async def startup_event():
             replace_existing=True
         )
         
+        # Host CPU/memory sample every second
+        scheduler.add_job(
+            sample_system_metrics,
+            IntervalTrigger(seconds=1),
+            id='system_metrics_sample',
+            replace_existing=True
+        )
+        
         # Market data update every 5 seconds
         scheduler.add_job(
             update_market_data,
@@ -542,7 +908,7 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Error starting scheduler: {e}")
     
-    system_state['last_updated'] = datetime.utcnow().isoformat()
+    update_state(last_updated=utc_now_iso())
     logger.info("🎯 ALGO-FRONTEND Trading Platform OPERATIONAL!")
 
 async def shutdown_event():
@@ -553,19 +919,26 @@ async def shutdown_event():
     if scheduler.running:
         scheduler.shutdown()
     
+    if ws_manager.broadcaster_task:
+        ws_manager.broadcaster_task.cancel()
+    if ws_manager.relay_task:
+        ws_manager.relay_task.cancel()
+    if periodic_frames_task:
+        periodic_frames_task.cancel()
+    
     # Disconnect TrueData
     await truedata_manager.disconnect()
     
     # Close database connections
     if db_pool:
-        if hasattr(db_pool, 'close'):
-            await db_pool.close()
+        await db_pool.close()
     
     # Close Redis connection
     if redis_pool:
         await redis_pool.close()
     
     logger.info("✅ Shutdown complete")
+    stop_log_queue()
 
 async def initialize_strategies():
     """Initialize trading strategies"""
@@ -580,7 +953,7 @@ async def initialize_strategies():
             # Initialize actual strategy instances here
             strategy_instances[name] = {"name": name, "enabled": True, "signals_generated": 0}
         
-        system_state['strategies_active'] = len(strategy_instances)
+        update_state(strategies_active=len(strategy_instances))
         logger.info(f"✅ Initialized {len(strategy_instances)} trading strategies")
         
     except Exception as e:
@@ -592,41 +965,37 @@ async def system_health_check():
         # Check database
         if db_pool:
             try:
-                if hasattr(db_pool, 'acquire'):
-                    async with db_pool.acquire() as conn:
-                        await conn.execute('SELECT 1')
-                else:
-                    await db_pool.execute('SELECT 1')
-                system_state['database_connected'] = True
+                async with db_pool.acquire() as conn:
+                    await conn.execute('SELECT 1')
+                update_state(database_connected=True)
             except:
-                system_state['database_connected'] = False
+                update_state(database_connected=False)
         
         # Check Redis
         if redis_pool:
             try:
                 await redis_pool.ping()
-                system_state['redis_connected'] = True
+                update_state(redis_connected=True)
             except:
-                system_state['redis_connected'] = False
+                update_state(redis_connected=False)
         
         # Update system health
-        if system_state['database_connected'] and system_state['redis_connected']:
-            system_state['system_health'] = 'HEALTHY'
-        else:
-            system_state['system_health'] = 'DEGRADED'
-        
-        system_state['last_updated'] = datetime.utcnow().isoformat()
+        healthy = system_state.database_connected and system_state.redis_connected
+        update_state(
+            system_health='HEALTHY' if healthy else 'DEGRADED',
+            last_updated=utc_now_iso()
+        )
         
         # Broadcast health update
-        await ws_manager.broadcast({
+        ws_manager.enqueue({
             "type": "health_update",
             "system_status": system_state,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+            "timestamp": utc_now_iso()
+        }, "health")
         
     except Exception as e:
         logger.error(f"Error in health check: {e}")
-        system_state['system_health'] = 'UNHEALTHY'
+        update_state(system_health='UNHEALTHY')
 
 async def update_market_data():
     """Update market data and broadcast to clients"""
@@ -634,20 +1003,21 @@ async def update_market_data():
         if not truedata_manager.connected:
             return
             
-        symbols = ["NIFTY", "BANKNIFTY", "FINNIFTY"]
-        market_updates = {}
-        
-        for symbol in symbols:
-            data = await truedata_manager.get_live_data(symbol)
-            if data:
-                market_updates[symbol] = data
+        results = await asyncio.gather(
+            *(truedata_manager.get_live_data(symbol) for symbol in MARKET_SYMBOLS),
+            return_exceptions=True
+        )
+        market_updates = {
+            symbol: data for symbol, data in zip(MARKET_SYMBOLS, results)
+            if data and not isinstance(data, Exception)
+        }
         
         if market_updates:
-            await ws_manager.broadcast({
+            ws_manager.enqueue({
                 "type": "market_data_update",
                 "data": market_updates,
-                "timestamp": datetime.utcnow().isoformat()
-            })
+                "timestamp": utc_now_iso()
+            }, "market")
             
     except Exception as e:
         logger.error(f"Error updating market data: {e}")
@@ -664,7 +1034,7 @@ async def root():
         "message": "ALGO-FRONTEND Elite Autonomous Trading Platform - Production Ready!",
         "version": "3.0.0",
         "status": "operational",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": utc_now_iso()
     }
 
 @api_router.get("/health")
@@ -672,24 +1042,24 @@ async def health_check():
     """Enhanced health check endpoint"""
     try:
         health_status = {
-            "status": system_state['system_health'].lower(),
-            "timestamp": datetime.utcnow().isoformat(),
+            "status": system_state.system_health.lower(),
+            "timestamp": utc_now_iso(),
             "components": {
-                "database": "connected" if system_state['database_connected'] else "disconnected",
-                "redis": "connected" if system_state['redis_connected'] else "disconnected",
-                "truedata": "connected" if system_state['truedata_connected'] else "disconnected",
-                "zerodha": "connected" if system_state['zerodha_connected'] else "disconnected",
-                "websocket": f"{system_state['websocket_connections']} clients connected",
+                "database": "connected" if system_state.database_connected else "disconnected",
+                "redis": "connected" if system_state.redis_connected else "disconnected",
+                "truedata": "connected" if system_state.truedata_connected else "disconnected",
+                "zerodha": "connected" if system_state.zerodha_connected else "disconnected",
+                "websocket": f"{system_state.websocket_connections} clients connected",
                 "scheduler": "running" if scheduler.running else "stopped"
             },
             "trading": {
-                "active": system_state['trading_active'],
-                "paper_trading": system_state['paper_trading'],
-                "autonomous": system_state['autonomous_trading'],
-                "market_open": system_state['market_open']
+                "active": system_state.trading_active,
+                "paper_trading": system_state.paper_trading,
+                "autonomous": system_state.autonomous_trading,
+                "market_open": system_state.market_open
             },
             "strategies": {
-                "total": system_state['strategies_active'],
+                "total": system_state.strategies_active,
                 "active": len([s for s in strategy_instances.values() if s.get('enabled', True)])
             }
         }
@@ -701,7 +1071,7 @@ async def health_check():
         return {
             "status": "error",
             "message": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now_iso()
         }
 
 @api_router.get("/system/status")
@@ -710,15 +1080,16 @@ async def get_system_status():
     try:
         return {
             "success": True,
-            "status": SystemStatus(**system_state).dict(),
+            # SystemState already has SystemStatus's shape; no need to revalidate it
+            "status": system_state,
             "market_data": {
                 "symbols_tracked": len(market_data_cache),
-                "last_update": max([data.get('timestamp', '') for data in market_data_cache.values()]) if market_data_cache else None
+                "last_update": last_market_update
             },
             "performance": {
-                "cpu_percent": psutil.cpu_percent(),
-                "memory_percent": psutil.virtual_memory().percent,
-                "uptime_seconds": time.time() - psutil.boot_time()
+                "cpu_percent": performance_metrics['cpu_percent'],
+                "memory_percent": performance_metrics['memory_percent'],
+                "uptime_seconds": time.time() - BOOT_TIME
             }
         }
     except Exception as e:
@@ -732,10 +1103,10 @@ async def connect_truedata():
         success = await truedata_manager.connect()
         
         if success:
-            await ws_manager.broadcast({
+            await ws_manager.publish({
                 "type": "truedata_connected",
                 "status": "connected",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             })
             
             return {
@@ -760,10 +1131,10 @@ async def disconnect_truedata():
     try:
         await truedata_manager.disconnect()
         
-        await ws_manager.broadcast({
+        await ws_manager.publish({
             "type": "truedata_disconnected",
             "status": "disconnected",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now_iso()
         })
         
         return {
@@ -804,7 +1175,7 @@ async def get_live_market_data():
             },
             "data_provider_status": "LIVE_DATA",
             "indices": market_data_cache,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now_iso()
         }
         
     except Exception as e:
@@ -840,7 +1211,7 @@ async def get_elite_recommendations():
             "status": "success",
             "count": len(recommendations),
             "recommendations": recommendations,
-            "scan_timestamp": datetime.utcnow().isoformat(),
+            "scan_timestamp": utc_now_iso(),
             "message": f"Found {len(recommendations)} elite recommendations (10/10 signals)"
         }
         
@@ -853,17 +1224,17 @@ async def get_autonomous_status():
     """Get autonomous trading system status"""
     try:
         return {
-            "status": system_state['system_health'],
-            "trading_active": system_state['trading_active'],
-            "paper_trading": system_state['paper_trading'],
-            "autonomous_trading": system_state['autonomous_trading'],
+            "status": system_state.system_health,
+            "trading_active": system_state.trading_active,
+            "paper_trading": system_state.paper_trading,
+            "autonomous_trading": system_state.autonomous_trading,
             "intraday_trading": INTRADAY_TRADING_ENABLED,
             "elite_recommendations": ELITE_RECOMMENDATIONS_ENABLED,
-            "strategies_active": system_state['strategies_active'],
-            "market_open": system_state['market_open'],
-            "daily_pnl": system_state['daily_pnl'],
+            "strategies_active": system_state.strategies_active,
+            "market_open": system_state.market_open,
+            "daily_pnl": system_state.daily_pnl,
             "components": {
-                "database": "CONNECTED" if system_state['database_connected'] else "DISCONNECTED",
+                "database": "CONNECTED" if system_state.database_connected else "DISCONNECTED",
                 "websocket": "ACTIVE",
                 "scheduler": "RUNNING" if scheduler.running else "STOPPED"
             }
@@ -886,41 +1257,38 @@ async def websocket_trading_data(websocket: WebSocket):
             "system_status": system_state,
             "market_data": market_data_cache,
             "strategies": strategy_instances,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now_iso()
         }
         
         await ws_manager.send_to_client(websocket, initial_data)
+        sent_revision = state_revision
         
         # Keep connection alive and handle incoming messages
         while True:
             try:
                 # Wait for client messages with timeout
                 data = await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
-                message = json.loads(data)
+                message = orjson.loads(data)
                 
                 # Handle client requests
                 if message.get("type") == "ping":
                     await ws_manager.send_to_client(websocket, {
                         "type": "pong",
-                        "timestamp": datetime.utcnow().isoformat()
+                        "timestamp": utc_now_iso()
                     })
                 elif message.get("type") == "subscribe":
                     # Handle subscription requests
                     await ws_manager.send_to_client(websocket, {
                         "type": "subscription_confirmed",
                         "subscribed_to": message.get("channels", []),
-                        "timestamp": datetime.utcnow().isoformat()
+                        "timestamp": utc_now_iso()
                     })
                 
             except asyncio.TimeoutError:
-                # Send periodic updates
-                update_data = {
-                    "type": "periodic_update",
-                    "system_status": system_state,
-                    "market_data": market_data_cache,
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                await ws_manager.send_to_client(websocket, update_data)
+                # Send the latest shared periodic update, or just a heartbeat
+                # if nothing changed since the last snapshot this client got
+                frame, sent_revision = next_periodic_frame(sent_revision)
+                await ws_manager.send_to_client(websocket, frame['text'])
                 
     except WebSocketDisconnect:
         logger.info("WebSocket client disconnected normally")
@@ -935,19 +1303,11 @@ async def autonomous_websocket_endpoint(websocket: WebSocket):
     await ws_manager.connect(websocket, {"type": "autonomous_data"})
     
     try:
+        await ws_manager.send_to_client(websocket, periodic_frames['autonomous']['text'])
+        
+        # Later updates come from periodic_frames_loop; just wait for the client to leave
         while True:
-            autonomous_data = {
-                "type": "autonomous_update",
-                "system_health": system_state['system_health'],
-                "trading_active": system_state['trading_active'],
-                "strategies_status": {name: {"enabled": data.get("enabled", True)} 
-                                   for name, data in strategy_instances.items()},
-                "market_status": "OPEN" if system_state['market_open'] else "CLOSED",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-            await ws_manager.send_to_client(websocket, autonomous_data)
-            await asyncio.sleep(10)  # Update every 10 seconds
+            await websocket.receive_text()
             
     except WebSocketDisconnect:
         logger.info("Autonomous WebSocket client disconnected")
@@ -967,7 +1327,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         content={
             "error": exc.detail,
             "status_code": exc.status_code,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
             "path": str(request.url)
         }
     )
@@ -983,7 +1343,7 @@ async def general_exception_handler(request: Request, exc: Exception):
         content={
             "error": "Internal server error",
             "message": "An unexpected error occurred",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
             "path": str(request.url)
         }
     )
@@ -998,10 +1358,35 @@ if __name__ == "__main__":
     # Create log directory if it doesn't exist
     os.makedirs('/var/log/algo-trading', exist_ok=True)
     
+    # libuv event loop and C HTTP parser where available, stdlib otherwise
+    try:
+        import uvloop
+        uvloop.install()
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "h11"
+    
+    # One worker only: the TrueData connection, system_state, market_data_cache
+    # and the scheduler all live in this process. Extra workers would each open
+    # their own TrueData session and run their own strategy loop, and state
+    # changed through the API would only reach the worker that served it.
+    # Scaling out needs that state in Redis and a single TrueData owner first.
     uvicorn.run(
         app, 
         host="0.0.0.0", 
         port=8001,
+        workers=1,
+        loop=loop_impl,
+        http=http_impl,
+        ws="websockets",
+        ws_max_size=2**20,
+        ws_ping_interval=20,
+        ws_ping_timeout=20,
         log_config={
             "version": 1,
             "disable_existing_loggers": False,
@@ -1016,15 +1401,12 @@ if __name__ == "__main__":
                     "class": "logging.StreamHandler",
                     "stream": "ext://sys.stdout",
                 },
-                "file": {
-                    "formatter": "default",
-                    "class": "logging.FileHandler",
-                    "filename": "/var/log/algo-trading/uvicorn.log",
-                },
             },
+            # Console only: the supervisor logs here, and each serving process
+            # swaps in the log queue at startup (start_log_queue)
             "root": {
                 "level": "INFO",
-                "handlers": ["default", "file"],
+                "handlers": ["default"],
             },
         }
     )
\ No newline at end of file
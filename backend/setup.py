@@ -7,10 +7,14 @@ setup(
     install_requires=[
         "fastapi>=0.68.0,<0.100.0",
         "uvicorn>=0.15.0,<0.25.0",
+        "uvloop>=0.17.0; sys_platform != 'win32'",
+        "httptools>=0.5.0",
         "pandas>=1.3.0,<2.0.0",
         "numpy>=1.20.0,<2.0.0",
         "pydantic>=1.8.0,<2.0.0",
         "aiohttp>=3.8.0,<4.0.0",
+        "orjson>=3.9.10",
+        "pyjwt[crypto]>=2.8.0",
         "plotly>=5.3.0,<6.0.0",
         "psutil>=5.8.0,<6.0.0",
         "python-dotenv>=0.19.0,<1.0.0",
@@ -2,19 +2,26 @@
 Authentication API endpoints
 """
 from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import jwt
+import base64
+import calendar
 import hashlib
-from typing import Optional
+import hmac
+import orjson
+from typing import Dict, Optional
 import os
+import time
 import logging
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 security = HTTPBearer()
 
 # Configuration
@@ -22,16 +29,52 @@ SECRET_KEY = os.getenv("JWT_SECRET", "your-secret-key-here")  # Use env variable
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Login attempts allowed per client IP per fixed window, checked before any hashing
+LOGIN_RATE_LIMIT = 20
+LOGIN_RATE_WINDOW = 60
+
+# Attempts are counted in the app's Redis client (app.state.redis, owned by the
+# app lifespan); per-process counts for the current window when it is missing or down
+login_window = 0
+login_attempts: Dict[str, int] = {}
+login_store_failing = False
+
+# Proxies (e.g. the load balancer) whose X-Forwarded-For is trusted for the client IP
+TRUSTED_PROXIES = frozenset(
+    address.strip() for address in os.getenv("TRUSTED_PROXIES", "").split(",") if address.strip()
+)
+
+# Token signing material, prepared once: the key bytes and the constant HS256 header
+_SECRET_BYTES = SECRET_KEY.encode()
+_HEADER_B64 = base64.urlsafe_b64encode(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"})).rstrip(b"=")
+
+# PyJWT's cryptography backend (the [crypto] extra) should be installed
+if not jwt.algorithms.has_crypto:
+    logger.warning("PyJWT cryptography backend not installed; install pyjwt[crypto]")
+
+# Raw SHA-256 digest of the default admin password, hashed once at import
+_ADMIN_EXPECTED = hashlib.sha256(b"admin123").digest()
+
+@dataclass(frozen=True, slots=True)
+class User:
+    """A login account"""
+    username: str
+    password_hash: bytes
+    full_name: str
+    email: str
+    is_active: bool = True
+    is_admin: bool = False
+
 # Default admin user (for initial setup)
 DEFAULT_USERS = {
-    "admin": {
-        "username": "admin",
-        "password_hash": hashlib.sha256("admin123".encode()).hexdigest(),
-        "full_name": "Admin User",
-        "email": "admin@algoauto.com",
-        "is_active": True,
-        "is_admin": True
-    }
+    "admin": User(
+        username="admin",
+        password_hash=_ADMIN_EXPECTED,
+        full_name="Admin User",
+        email="admin@algoauto.com",
+        is_active=True,
+        is_admin=True
+    )
 }
 
 class LoginRequest(BaseModel):
@@ -51,19 +94,93 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=15)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = encode_token(to_encode)
     return encoded_jwt
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify password against hash"""
-    return hashlib.sha256(plain_password.encode()).hexdigest() == hashed_password
+# Registered claims that must be NumericDate (integer seconds since the epoch)
+TIME_CLAIMS = ("exp", "iat", "nbf")
+
+def encode_token(payload: dict) -> str:
+    """Sign an HS256 JWT with the prepared header and key; jwt.decode reads it back"""
+    # datetime time claims become integer timestamps, as jwt.encode does
+    # (naive datetimes are taken as UTC)
+    claims = payload
+    for claim in TIME_CLAIMS:
+        if isinstance(payload.get(claim), datetime):
+            if claims is payload:
+                claims = payload.copy()
+            claims[claim] = calendar.timegm(payload[claim].utctimetuple())
+    payload_b64 = base64.urlsafe_b64encode(orjson.dumps(claims)).rstrip(b"=")
+    signing_input = _HEADER_B64 + b"." + payload_b64
+    signature = hmac.new(_SECRET_BYTES, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + base64.urlsafe_b64encode(signature).rstrip(b"=")).decode()
+
+def verify_password(plain_password: str, hashed_password: bytes) -> bool:
+    """Verify password against hash in constant time"""
+    return hmac.compare_digest(hashlib.sha256(plain_password.encode()).digest(), hashed_password)
+
+def client_address(request: Request) -> str:
+    """Client IP; X-Forwarded-For is only believed when the direct peer is a trusted proxy"""
+    peer = request.client.host if request.client else "unknown"
+    forwarded = request.headers.get("x-forwarded-for")
+    if peer not in TRUSTED_PROXIES or not forwarded:
+        return peer
+    # The rightmost address our own proxies did not add is the real client
+    for address in reversed(forwarded.split(",")):
+        address = address.strip()
+        if address and address not in TRUSTED_PROXIES:
+            return address
+    return peer
+
+def count_login_locally(client_ip: str, window: int) -> int:
+    """Count an attempt in this process's counter for the current window"""
+    global login_window, login_attempts
+    # A new window starts every IP from zero
+    if window != login_window:
+        login_window = window
+        login_attempts = {}
+    count = login_attempts.get(client_ip, 0) + 1
+    login_attempts[client_ip] = count
+    return count
+
+async def login_ratelimit(request: Request):
+    """Reject clients over LOGIN_RATE_LIMIT login attempts in the current window"""
+    global login_store_failing
+    client_ip = client_address(request)
+    window = int(time.time() // LOGIN_RATE_WINDOW)
+    redis_client = getattr(request.app.state, "redis", None)
+    
+    if redis_client is None:
+        count = count_login_locally(client_ip, window)
+    else:
+        try:
+            key = f"rl:login:{client_ip}:{window}"
+            pipe = redis_client.pipeline(transaction=True)
+            pipe.incr(key)
+            pipe.expire(key, LOGIN_RATE_WINDOW * 2)
+            count, _ = await pipe.execute()
+            login_store_failing = False
+        except Exception as e:
+            # Warn once per outage, not on every attempt
+            if not login_store_failing:
+                logger.warning(f"Redis login rate limit unavailable, using local counter: {e}")
+                login_store_failing = True
+            count = count_login_locally(client_ip, window)
+    
+    if count > LOGIN_RATE_LIMIT:
+        logger.warning(f"Login rate limit exceeded for {client_ip}")
+        raise HTTPException(
+            status_code=429,
+            detail="Too many login attempts, try again later"
+        )
 
-@router.post("/login")
+@router.post("/login", dependencies=[Depends(login_ratelimit)])
 async def login(request: Request, login_data: LoginRequest):
     """Login endpoint"""
-    logger.info(f"Login attempt for user: {login_data.username}")
-    logger.info(f"Request headers: {dict(request.headers)}")
-    logger.info(f"Request origin: {request.headers.get('origin', 'unknown')}")
+    logger.info("Login attempt for user: %s", login_data.username)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Request headers: %s", dict(request.headers))
+        logger.debug("Request origin: %s", request.headers.get('origin', 'unknown'))
     
     # Check if user exists
     user = DEFAULT_USERS.get(login_data.username)
@@ -76,7 +193,7 @@ async def login(request: Request, login_data: LoginRequest):
         )
     
     # Verify password
-    if not verify_password(login_data.password, user["password_hash"]):
+    if not verify_password(login_data.password, user.password_hash):
         logger.warning(f"Invalid password for user: {login_data.username}")
         raise HTTPException(
             status_code=401,
@@ -84,7 +201,7 @@ async def login(request: Request, login_data: LoginRequest):
         )
     
     # Check if user is active
-    if not user.get("is_active", True):
+    if not user.is_active:
         logger.warning(f"User is inactive: {login_data.username}")
         raise HTTPException(
             status_code=403,
@@ -96,7 +213,7 @@ async def login(request: Request, login_data: LoginRequest):
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user["username"], "is_admin": user.get("is_admin", False)},
+        data={"sub": user.username, "is_admin": user.is_admin},
         expires_delta=access_token_expires
     )
     
@@ -106,21 +223,21 @@ async def login(request: Request, login_data: LoginRequest):
         "access_token": access_token,
         "token_type": "bearer",
         "user": {
-            "username": user["username"],
-            "email": user["email"],
-            "role": "admin" if user.get("is_admin", False) else "trader",
+            "username": user.username,
+            "email": user.email,
+            "role": "admin" if user.is_admin else "trader",
             "capital": 100000,  # Default capital
-            "permissions": ["trade", "view_analytics"] if user.get("is_admin", False) else ["trade"]
+            "permissions": ["trade", "view_analytics"] if user.is_admin else ["trade"]
         },
         "user_info": {
-            "username": user["username"],
-            "full_name": user["full_name"],
-            "email": user["email"],
-            "is_admin": user.get("is_admin", False)
+            "username": user.username,
+            "full_name": user.full_name,
+            "email": user.email,
+            "is_admin": user.is_admin
         }
     }
     
-    logger.info(f"Returning login response for user: {login_data.username}")
+    logger.debug("Returning login response for user: %s", login_data.username)
     return response
 
 @router.get("/me")
@@ -139,10 +256,10 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             raise HTTPException(status_code=404, detail="User not found")
         
         return {
-            "username": user["username"],
-            "full_name": user["full_name"],
-            "email": user["email"],
-            "is_admin": user.get("is_admin", False)
+            "username": user.username,
+            "full_name": user.full_name,
+            "email": user.email,
+            "is_admin": user.is_admin
         }
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
@@ -167,15 +284,15 @@ async def test_auth():
 @router.get("/debug")
 async def debug_auth():
     """Debug endpoint to check auth configuration"""
-    admin_user = DEFAULT_USERS.get("admin", {})
-    expected_hash = hashlib.sha256("admin123".encode()).hexdigest()
+    admin_user = DEFAULT_USERS.get("admin")
+    actual_hash = admin_user.password_hash if admin_user else None
     
     return {
         "auth_configured": True,
         "admin_user_exists": "admin" in DEFAULT_USERS,
-        "admin_password_hash_matches": admin_user.get("password_hash") == expected_hash,
-        "expected_hash": expected_hash,
-        "actual_hash": admin_user.get("password_hash", "NOT_SET"),
+        "admin_password_hash_matches": actual_hash == _ADMIN_EXPECTED,
+        "expected_hash": _ADMIN_EXPECTED.hex(),
+        "actual_hash": actual_hash.hex() if actual_hash else "NOT_SET",
         "jwt_secret_configured": bool(SECRET_KEY),
         "cors_note": "Make sure CORS is properly configured in main.py"
     } 
\ No newline at end of file
@@ -4,7 +4,7 @@ Shows live market data for major indices
 """
 from fastapi import APIRouter, HTTPException
 from typing import Dict, List, Any
-from datetime import datetime
+from datetime import datetime, time
 import os
 import logging
 
@@ -14,6 +14,13 @@ router = APIRouter()
 # Global variable to store market data
 market_data_cache = {}
 
+# Market timings (IST)
+PRE_OPEN_START = time(9, 0)
+PRE_OPEN_END = time(9, 15)
+MARKET_OPEN = time(9, 15)
+MARKET_CLOSE = time(15, 30)
+POST_CLOSE_END = time(16, 0)
+
 @router.get("/indices")
 async def get_market_indices():
     """Get live market indices data"""
@@ -76,24 +83,17 @@ async def get_market_status():
         now = datetime.now()
         current_time = now.time()
         
-        # Market timings (IST)
-        pre_open_start = datetime.strptime("09:00", "%H:%M").time()
-        pre_open_end = datetime.strptime("09:15", "%H:%M").time()
-        market_open = datetime.strptime("09:15", "%H:%M").time()
-        market_close = datetime.strptime("15:30", "%H:%M").time()
-        post_close_end = datetime.strptime("16:00", "%H:%M").time()
-        
         # Determine market phase
-        if current_time < pre_open_start:
+        if current_time < PRE_OPEN_START:
             phase = "PRE_MARKET"
             status = "CLOSED"
-        elif pre_open_start <= current_time < pre_open_end:
+        elif PRE_OPEN_START <= current_time < PRE_OPEN_END:
             phase = "PRE_OPEN"
             status = "PRE_OPEN"
-        elif market_open <= current_time < market_close:
+        elif MARKET_OPEN <= current_time < MARKET_CLOSE:
             phase = "NORMAL"
             status = "OPEN"
-        elif market_close <= current_time < post_close_end:
+        elif MARKET_CLOSE <= current_time < POST_CLOSE_END:
             phase = "POST_CLOSE"
             status = "POST_CLOSE"
         else:
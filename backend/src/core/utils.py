@@ -1,4 +1,5 @@
 import logging
+import time as _time
 from typing import Dict, Any, Optional, List
 from datetime import datetime, date, time
 
@@ -46,6 +47,21 @@ def format_date_for_api(date_object: Optional[date]) -> Optional[str]:
         return str(date_object)
     return date_object.isoformat()
 
+# Timestamp cache for utc_now_iso: the current second and its ISO string
+_iso_clock = {'second': -1, 'iso': ''}
+
+def utc_now_iso() -> str:
+    """
+    Returns the current UTC time as an ISO-8601 string, truncated to the second.
+    The string is formatted once per second and shared by every caller within it,
+    for hot paths such as WebSocket frames that only need second resolution.
+    """
+    second = int(_time.time())
+    if second != _iso_clock['second']:
+        _iso_clock['iso'] = datetime.utcfromtimestamp(second).isoformat()
+        _iso_clock['second'] = second
+    return _iso_clock['iso']
+
 # Example of a more specific utility if needed elsewhere, e.g. for normalizing symbol names
 def normalize_symbol(symbol: str) -> str:
     """
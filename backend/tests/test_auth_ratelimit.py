@@ -0,0 +1,119 @@
+import logging
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+from fastapi import HTTPException
+
+# Module to test
+from backend.src.api import auth
+
+# Suppress most logging for tests unless specifically debugging
+logging.basicConfig(level=logging.CRITICAL)
+
+
+def make_request(host="203.0.113.5", headers=None, redis_client=None):
+    """Minimal stand-in for a Starlette Request as seen by login_ratelimit"""
+    request = MagicMock()
+    request.client.host = host
+    request.headers = headers or {}
+    request.app.state.redis = redis_client
+    return request
+
+
+def make_redis(count=None, error=None):
+    """Redis client whose INCR/EXPIRE pipeline returns count, or raises error"""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(side_effect=error, return_value=[count, True])
+    client = MagicMock()
+    client.pipeline.return_value = pipe
+    return client, pipe
+
+
+class TestLoginRateLimit(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        auth.login_window = 0
+        auth.login_attempts = {}
+        auth.login_store_failing = False
+
+    async def test_local_counter_allows_limit_then_rejects(self):
+        request = make_request()
+        for _ in range(auth.LOGIN_RATE_LIMIT):
+            await auth.login_ratelimit(request)
+
+        with self.assertRaises(HTTPException) as ctx:
+            await auth.login_ratelimit(request)
+        self.assertEqual(ctx.exception.status_code, 429)
+
+    async def test_local_counter_is_per_ip(self):
+        for _ in range(auth.LOGIN_RATE_LIMIT):
+            await auth.login_ratelimit(make_request(host="203.0.113.5"))
+
+        # A different client still has its full allowance
+        await auth.login_ratelimit(make_request(host="203.0.113.6"))
+
+    async def test_local_counter_resets_each_window(self):
+        request = make_request()
+        with patch.object(auth.time, "time", return_value=0.0):
+            for _ in range(auth.LOGIN_RATE_LIMIT):
+                await auth.login_ratelimit(request)
+        with patch.object(auth.time, "time", return_value=float(auth.LOGIN_RATE_WINDOW)):
+            await auth.login_ratelimit(request)
+        self.assertEqual(auth.login_attempts, {"203.0.113.5": 1})
+
+    async def test_redis_count_under_limit_passes(self):
+        client, pipe = make_redis(count=auth.LOGIN_RATE_LIMIT)
+        await auth.login_ratelimit(make_request(redis_client=client))
+
+        client.pipeline.assert_called_once_with(transaction=True)
+        key = pipe.incr.call_args.args[0]
+        self.assertTrue(key.startswith("rl:login:203.0.113.5:"))
+        pipe.expire.assert_called_once_with(key, auth.LOGIN_RATE_WINDOW * 2)
+        self.assertEqual(auth.login_attempts, {})
+
+    async def test_redis_count_over_limit_rejects(self):
+        client, _ = make_redis(count=auth.LOGIN_RATE_LIMIT + 1)
+        with self.assertRaises(HTTPException) as ctx:
+            await auth.login_ratelimit(make_request(redis_client=client))
+        self.assertEqual(ctx.exception.status_code, 429)
+
+    async def test_redis_failure_falls_back_and_warns_once(self):
+        client, _ = make_redis(error=ConnectionError("down"))
+        request = make_request(redis_client=client)
+
+        with self.assertLogs(auth.logger, level="WARNING") as logs:
+            await auth.login_ratelimit(request)
+            await auth.login_ratelimit(request)
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(auth.login_attempts, {"203.0.113.5": 2})
+
+        # Recovery re-arms the warning for the next outage
+        healthy, _ = make_redis(count=1)
+        await auth.login_ratelimit(make_request(redis_client=healthy))
+        self.assertFalse(auth.login_store_failing)
+
+
+class TestClientAddress(unittest.TestCase):
+
+    def test_forwarded_header_ignored_from_untrusted_peer(self):
+        request = make_request(host="198.51.100.7", headers={"x-forwarded-for": "1.2.3.4"})
+        with patch.object(auth, "TRUSTED_PROXIES", frozenset({"10.0.0.1"})):
+            self.assertEqual(auth.client_address(request), "198.51.100.7")
+
+    def test_forwarded_header_used_from_trusted_proxy(self):
+        # Spoofed leftmost entry is skipped; the proxy chain is peeled from the right
+        request = make_request(
+            host="10.0.0.1",
+            headers={"x-forwarded-for": "6.6.6.6, 203.0.113.9, 10.0.0.2"}
+        )
+        with patch.object(auth, "TRUSTED_PROXIES", frozenset({"10.0.0.1", "10.0.0.2"})):
+            self.assertEqual(auth.client_address(request), "203.0.113.9")
+
+    def test_trusted_proxy_without_header_uses_peer(self):
+        request = make_request(host="10.0.0.1")
+        with patch.object(auth, "TRUSTED_PROXIES", frozenset({"10.0.0.1"})):
+            self.assertEqual(auth.client_address(request), "10.0.0.1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import calendar
+import logging
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import jwt
+
+# Module to test
+from backend.src.api import auth
+
+# Suppress most logging for tests unless specifically debugging
+logging.basicConfig(level=logging.CRITICAL)
+
+
+class TestEncodeToken(unittest.TestCase):
+
+    def decode(self, token, **options):
+        return jwt.decode(token, auth.SECRET_KEY, algorithms=["HS256"], **options)
+
+    def test_round_trip_through_pyjwt(self):
+        token = auth.create_access_token({"sub": "admin", "is_admin": True}, timedelta(minutes=5))
+        payload = self.decode(token)
+
+        self.assertEqual(payload["sub"], "admin")
+        self.assertIs(payload["is_admin"], True)
+        self.assertEqual(jwt.get_unverified_header(token), {"alg": "HS256", "typ": "JWT"})
+
+    def test_matches_pyjwt_encoding(self):
+        claims = {"sub": "admin", "exp": 2_000_000_000}
+        self.assertEqual(auth.encode_token(claims), jwt.encode(claims, auth.SECRET_KEY, algorithm="HS256"))
+
+    def test_exp_is_numeric_date_and_checked(self):
+        before = calendar.timegm(datetime.utcnow().utctimetuple())
+        token = auth.create_access_token({"sub": "admin"}, timedelta(minutes=30))
+        exp = self.decode(token)["exp"]
+
+        self.assertIsInstance(exp, int)
+        self.assertAlmostEqual(exp - before, 30 * 60, delta=2)
+
+    def test_expired_token_rejected(self):
+        token = auth.create_access_token({"sub": "admin"}, timedelta(seconds=-10))
+        with self.assertRaises(jwt.ExpiredSignatureError):
+            self.decode(token)
+
+    def test_datetime_time_claims_are_coerced(self):
+        issued = datetime(2030, 1, 1, tzinfo=timezone.utc)
+        claims = {
+            "sub": "admin",
+            "iat": issued,
+            "nbf": issued,
+            "exp": (issued + timedelta(hours=1)).replace(tzinfo=None),  # naive is UTC
+        }
+        token = auth.encode_token(claims)
+        payload = self.decode(token, options={"verify_exp": False, "verify_nbf": False, "verify_iat": False})
+
+        self.assertEqual(payload["iat"], calendar.timegm(issued.utctimetuple()))
+        self.assertEqual(payload["nbf"], payload["iat"])
+        self.assertEqual(payload["exp"], payload["iat"] + 3600)
+        # The caller's dict is left untouched
+        self.assertIsInstance(claims["exp"], datetime)
+
+    def test_wrong_secret_rejected(self):
+        token = auth.encode_token({"sub": "admin"})
+        with self.assertRaises(jwt.InvalidSignatureError):
+            jwt.decode(token, "not-the-secret", algorithms=["HS256"])
+
+
+if __name__ == '__main__':
+    unittest.main()
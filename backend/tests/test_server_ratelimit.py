@@ -0,0 +1,50 @@
+import logging
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+# Module to test
+from backend import server_fixed_with_issues as server
+
+# Suppress most logging for tests unless specifically debugging
+logging.basicConfig(level=logging.CRITICAL)
+
+
+def make_redis(count=None, error=None):
+    """Redis pool whose INCR/EXPIRE pipeline returns count, or raises error"""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(side_effect=error, return_value=[count, True])
+    pool = MagicMock()
+    pool.pipeline.return_value = pipe
+    return pool
+
+
+class TestRateLimitMiddleware(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.saved_state = server.system_state
+        server.update_state(redis_connected=True)
+        self.middleware = server.RateLimitMiddleware(MagicMock(), requests_per_minute=2)
+
+    async def asyncTearDown(self):
+        server.system_state = self.saved_state
+
+    async def test_redis_count_is_used(self):
+        with patch.object(server, "redis_pool", make_redis(count=7)):
+            self.assertEqual(await self.middleware.count_request("203.0.113.5", 1), 7)
+        self.assertEqual(self.middleware.clients, {})
+
+    async def test_redis_failure_falls_back_and_warns_once(self):
+        with patch.object(server, "redis_pool", make_redis(error=ConnectionError("down"))):
+            with self.assertLogs(server.logger, level="WARNING") as logs:
+                self.assertEqual(await self.middleware.count_request("203.0.113.5", 1), 1)
+                self.assertEqual(await self.middleware.count_request("203.0.113.5", 1), 2)
+        self.assertEqual(len(logs.records), 1)
+
+        # Recovery re-arms the warning for the next outage
+        with patch.object(server, "redis_pool", make_redis(count=1)):
+            await self.middleware.count_request("203.0.113.5", 1)
+        self.assertFalse(self.middleware.redis_failing)
+
+
+if __name__ == '__main__':
+    unittest.main()
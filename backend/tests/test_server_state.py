@@ -0,0 +1,130 @@
+import logging
+import unittest
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
+
+# Module to test
+from backend import server_fixed_with_issues as server
+
+# Suppress most logging for tests unless specifically debugging
+logging.basicConfig(level=logging.CRITICAL)
+
+
+class StateTestCase(unittest.TestCase):
+    """Restores the module's shared state after each test"""
+
+    def setUp(self):
+        self.saved_state = server.system_state
+        self.saved_revision = server.state_revision
+        self.saved_frames = dict(server.periodic_frames)
+        server.autonomous_state_changed.clear()
+
+    def tearDown(self):
+        server.system_state = self.saved_state
+        server.state_revision = self.saved_revision
+        server.periodic_frames.update(self.saved_frames)
+        server.autonomous_state_changed.clear()
+
+
+class TestUpdateState(StateTestCase):
+
+    def test_state_is_frozen_and_replaced(self):
+        before = server.system_state
+        with self.assertRaises(FrozenInstanceError):
+            before.trading_active = False
+
+        server.update_state(daily_pnl=before.daily_pnl + 1)
+        self.assertIsNot(server.system_state, before)
+        self.assertEqual(server.system_state.daily_pnl, before.daily_pnl + 1)
+        self.assertEqual(before.daily_pnl, self.saved_state.daily_pnl)
+
+    def test_revision_only_bumps_on_real_change(self):
+        revision = server.state_revision
+        server.update_state(daily_pnl=server.system_state.daily_pnl)
+        self.assertEqual(server.state_revision, revision)
+
+        server.update_state(daily_pnl=server.system_state.daily_pnl + 1)
+        self.assertEqual(server.state_revision, revision + 1)
+
+    def test_autonomous_fields_wake_the_producer(self):
+        server.update_state(websocket_connections=server.system_state.websocket_connections + 1)
+        self.assertFalse(server.autonomous_state_changed.is_set())
+
+        server.update_state(trading_active=server.system_state.trading_active)
+        self.assertFalse(server.autonomous_state_changed.is_set())
+
+        server.update_state(trading_active=not server.system_state.trading_active)
+        self.assertTrue(server.autonomous_state_changed.is_set())
+
+
+class TestMarketHoursCache(StateTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.saved_cache = dict(server.market_hours_cache)
+
+    def tearDown(self):
+        server.market_hours_cache.update(self.saved_cache)
+        super().tearDown()
+
+    def test_answer_reused_within_a_second(self):
+        server.update_state(market_open=True)
+        server.market_hours_cache['checked_at'] = server.time.monotonic()
+        with patch.object(server, "datetime") as mock_datetime:
+            self.assertTrue(server.is_market_open())
+        mock_datetime.now.assert_not_called()
+
+    def test_recomputed_after_a_second(self):
+        monday, sunday = server.datetime(2026, 10, 19, 10, 0), server.datetime(2026, 10, 18, 10, 0)
+        server.market_hours_cache['checked_at'] = float('-inf')
+        with patch.object(server, "datetime") as mock_datetime:
+            mock_datetime.now.return_value = monday
+            self.assertTrue(server.is_market_open())
+            mock_datetime.now.return_value = sunday
+            server.market_hours_cache['checked_at'] = float('-inf')
+            self.assertFalse(server.is_market_open())
+
+    def test_boundaries_rebuilt_when_the_date_rolls_over(self):
+        monday, tuesday = server.datetime(2026, 10, 19, 16, 0), server.datetime(2026, 10, 20, 9, 30)
+        with patch.object(server, "datetime") as mock_datetime:
+            for now in (monday, tuesday):
+                mock_datetime.now.return_value = now
+                server.market_hours_cache['checked_at'] = float('-inf')
+                server.is_market_open()
+        self.assertEqual(server.market_hours_cache['date'], tuesday.date())
+        self.assertEqual(server.market_hours_cache['open'], server.datetime(2026, 10, 20, 9, 15))
+        self.assertTrue(server.system_state.market_open)
+
+
+class TestPeriodicFrameSelection(StateTestCase):
+
+    def test_heartbeat_when_client_is_current(self):
+        server.build_periodic_frames()
+        frame, revision = server.next_periodic_frame(server.state_revision)
+
+        self.assertEqual(frame['message']['type'], "heartbeat")
+        self.assertEqual(revision, server.state_revision)
+
+    def test_snapshot_after_a_change_then_heartbeat(self):
+        server.build_periodic_frames()
+        sent = server.state_revision
+
+        server.update_state(daily_pnl=server.system_state.daily_pnl + 1)
+        server.build_periodic_frames()
+        frame, sent = server.next_periodic_frame(sent)
+        self.assertEqual(frame['message']['type'], "periodic_update")
+        self.assertEqual(sent, server.state_revision)
+
+        frame, _ = server.next_periodic_frame(sent)
+        self.assertEqual(frame['message']['type'], "heartbeat")
+
+    def test_frame_older_than_client_is_not_resent(self):
+        server.build_periodic_frames()
+        # A client that connected after the frame was built already has newer state
+        server.update_state(daily_pnl=server.system_state.daily_pnl + 1)
+        frame, _ = server.next_periodic_frame(server.state_revision)
+        self.assertEqual(frame['message']['type'], "heartbeat")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+# Module to test
+from backend import server_fixed_with_issues as server
+
+# Suppress most logging for tests unless specifically debugging
+logging.basicConfig(level=logging.CRITICAL)
+
+
+def make_websocket(subprotocols=None, channels=None):
+    """Stand-in for a Starlette WebSocket as used by WebSocketManager"""
+    websocket = MagicMock()
+    websocket.scope = {"subprotocols": subprotocols or []}
+    websocket.query_params = {"channels": channels} if channels else {}
+    websocket.accept = AsyncMock()
+    websocket.send_text = AsyncMock()
+    websocket.send_bytes = AsyncMock()
+    return websocket
+
+
+class TestWebSocketManager(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.saved_state = server.system_state
+        self.manager = server.WebSocketManager()
+
+    async def asyncTearDown(self):
+        server.system_state = self.saved_state
+
+    async def connect(self, client_type, **kwargs):
+        websocket = make_websocket(**kwargs)
+        await self.manager.connect(websocket, {"type": client_type})
+        # Drop connection_established
+        websocket.send_text.reset_mock()
+        websocket.send_bytes.reset_mock()
+        return websocket
+
+    async def test_channel_subscription(self):
+        market_only = await self.connect("trading_data", channels="market")
+        everything = await self.connect("trading_data")
+
+        await self.manager.broadcast({"type": "health_update"}, "health")
+        market_only.send_text.assert_not_called()
+        everything.send_text.assert_awaited_once()
+
+    async def test_disconnect_leaves_every_channel(self):
+        websocket = await self.connect("trading_data")
+        self.manager.disconnect(websocket)
+
+        self.assertNotIn(websocket, self.manager.connections)
+        for members in self.manager.channels.values():
+            self.assertNotIn(websocket, members)
+
+
+    async def test_empty_stream_sends_to_nobody(self):
+        trading = await self.connect("trading_data")
+
+        await self.manager.broadcast({"type": "autonomous_update"},
+                                     targets=self.manager.streams["autonomous_data"])
+        trading.send_text.assert_not_called()
+
+    async def test_stream_broadcast_reaches_only_its_clients(self):
+        trading = await self.connect("trading_data")
+        autonomous = await self.connect("autonomous_data")
+
+        await self.manager.broadcast({"type": "autonomous_update"},
+                                     targets=self.manager.streams["autonomous_data"])
+        autonomous.send_text.assert_awaited_once()
+        trading.send_text.assert_not_called()
+
+    async def test_disconnect_leaves_its_stream(self):
+        websocket = await self.connect("autonomous_data")
+        self.manager.disconnect(websocket)
+        self.assertNotIn(websocket, self.manager.streams["autonomous_data"])
+
+    async def test_stalled_client_is_disconnected(self):
+        healthy = await self.connect("trading_data")
+        stalled = await self.connect("trading_data")
+
+        async def stall(payload):
+            await asyncio.sleep(1)
+
+        stalled.send_text.side_effect = stall
+
+        with patch.object(server, "WS_SEND_TIMEOUT", 0.01):
+            await self.manager.broadcast({"type": "ping"})
+
+        healthy.send_text.assert_awaited_once()
+        self.assertIn(healthy, self.manager.connections)
+        self.assertNotIn(stalled, self.manager.connections)
+
+    async def test_failed_send_is_disconnected(self):
+        broken = await self.connect("trading_data")
+        broken.send_text.side_effect = RuntimeError("closed")
+
+        await self.manager.broadcast({"type": "ping"})
+        self.assertNotIn(broken, self.manager.connections)
+
+    async def test_concurrent_sends_are_bounded(self):
+        in_flight = 0
+        peak = 0
+
+        async def slow_send(payload):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        self.manager.send_limit = asyncio.Semaphore(3)
+        clients = [await self.connect("trading_data") for _ in range(10)]
+        for websocket in clients:
+            websocket.send_text.side_effect = slow_send
+
+        await self.manager.broadcast({"type": "ping"})
+        self.assertEqual(peak, 3)
+        self.assertEqual(len(self.manager.connections), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()